@@ -18,6 +18,23 @@ except Exception:
 db = SQLAlchemy()
 migrate = Migrate()
 
+
+# ─── JSON provider: orjson (3-10× faster than stdlib json) ──────────
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class ORJSONProvider(DefaultJSONProvider):
+        """Back jsonify/request.get_json with orjson."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+except Exception:
+    ORJSONProvider = None
+
 # ─── Import models so Migrate/CLI sees them ──────────────────────────
 import app.models  # noqa: F401
 
@@ -36,6 +53,10 @@ def create_app() -> Flask:
     # Debug flag (you can override via env FLASK_DEBUG=1)
     app.debug = bool(os.getenv('FLASK_DEBUG', '1') == '1')
 
+    # ─── Fast JSON responses ─────────────────────────────────────────
+    if ORJSONProvider is not None:
+        app.json = ORJSONProvider(app)
+
     # ─── Proxies (Render/NGINX) ──────────────────────────────────────
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
 
@@ -47,6 +68,19 @@ def create_app() -> Flask:
     from app.utils.jinja_filters import register_jinja_filters
     register_jinja_filters(app)
 
+    # ─── Jinja bytecode cache ────────────────────────────────────────
+    # Persist compiled templates on disk so each worker (and each deploy
+    # of unchanged templates) skips recompilation.
+    try:
+        from jinja2 import FileSystemBytecodeCache
+        cache_dir = os.path.join(app.instance_path, 'jinja_cache')
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(
+            directory=cache_dir, pattern='__jinja2_%s.cache'
+        )
+    except OSError:
+        pass  # unwritable instance dir — compile in memory as before
+
     # ─── Blueprints ─────────────────────────────────────────────────
     from app.home.routes              import home_bp
     from app.clients.routes           import clients_bp
@@ -4,26 +4,46 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import calendar
 
+# calamine (Rust) reads xlsx several times faster than openpyxl; these
+# workbooks carry plain values, no formulas or styles to preserve.
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_KW = {'engine': 'calamine'}
+except ImportError:
+    _EXCEL_KW = {'engine': 'openpyxl',
+                 'engine_kwargs': {'read_only': True, 'data_only': True}}
+
 INSTANCE_PATH = Path(__file__).parents[2] / 'instance' / 'reports' / 'daily_checkins.xlsx'
 STATIC_PATH   = Path(__file__).parents[1] / 'static'   / 'reports' / 'daily_checkins.xlsx'
 
+# Parsed-workbook cache: path -> (mtime_ns, size, sheets dict).
+# Re-parsing the whole workbook per request dwarfs every other cost here,
+# and the file only changes when a check-in is saved.
+_SHEETS_CACHE: dict = {}
+
 
 def load_sheets() -> dict:
     for path in (INSTANCE_PATH, STATIC_PATH):
         try:
-            xl = pd.ExcelFile(path)
-            break
+            stat = path.stat()
+        except OSError:
+            continue
+        key = str(path)
+        hit = _SHEETS_CACHE.get(key)
+        if hit is not None and hit[0] == stat.st_mtime_ns and hit[1] == stat.st_size:
+            return hit[2]
+        try:
+            xl = pd.ExcelFile(path, **_EXCEL_KW)
         except Exception:
             continue
-    else:
-        raise FileNotFoundError(f"Can't open daily_checkins.xlsx at {INSTANCE_PATH} or {STATIC_PATH}")
-
-    data = {}
-    for sheet in xl.sheet_names:
-        df = xl.parse(sheet)
-        df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-        data[sheet] = df
-    return data
+        data = {}
+        for sheet in xl.sheet_names:
+            df = xl.parse(sheet)
+            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+            data[sheet] = df
+        _SHEETS_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+    raise FileNotFoundError(f"Can't open daily_checkins.xlsx at {INSTANCE_PATH} or {STATIC_PATH}")
 
 
 def summarize_sales(df: pd.DataFrame) -> dict:
@@ -1,30 +1,48 @@
 # File: app/charts/exporters.py
 
-import pandas as pd
+from openpyxl import Workbook
+from app import db
 from app.models import ChartEntry
 
+
 def export_client_charts_to_excel(client: str, excel_path: str, tabs=None):
     """
     Query ChartEntry for each sheet and write an .xlsx with one tab per sheet.
     Always creates a sheet (even if empty) to avoid corrupt files.
     """
-    from app.charts.routes import EXPECTED_TABS, DEFAULT_COLUMNS
+    from app.charts.routes import EXPECTED_TABS, DEFAULT_ROWS
 
     if tabs is None:
         tabs = EXPECTED_TABS
 
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-        for tab in tabs:
-            records = (
-                ChartEntry.query
-                          .filter_by(client_name=client, sheet=tab)
-                          .order_by(ChartEntry.created_at)
-                          .all()
-            )
-            if records:
-                df = pd.DataFrame([r.data for r in records])
-            else:
-                cols = DEFAULT_COLUMNS.get(tab, [f'Field {i+1}' for i in range(3)])
-                df = pd.DataFrame(columns=cols)
-
-            df.to_excel(writer, sheet_name=tab.capitalize(), index=False)
+    # write_only streams each row straight to the sheet XML instead of
+    # holding a full cell grid (plus pandas' DataFrame copy) in memory.
+    wb = Workbook(write_only=True)
+    for tab in tabs:
+        ws = wb.create_sheet(str(tab).capitalize())
+
+        rows = (
+            db.session.query(ChartEntry.data)
+                      .filter_by(client_name=client, sheet=tab)
+                      .order_by(ChartEntry.created_at)
+                      .yield_per(500)
+        )
+
+        columns: list = []
+        buffered = []
+        for (data,) in rows:
+            data = data or {}
+            for key in data:
+                if key not in columns:
+                    columns.append(key)
+            buffered.append(data)
+
+        if not columns:
+            defaults = DEFAULT_ROWS.get(tab)
+            columns = list(defaults[0]) if defaults else [f'Field {i+1}' for i in range(3)]
+
+        ws.append(columns)
+        for data in buffered:
+            ws.append([data.get(col, '') for col in columns])
+
+    wb.save(excel_path)
@@ -1,15 +1,31 @@
 # app/charts/routes.py
-import copy
-from pathlib import Path
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
 from uuid import uuid4
 from datetime import datetime, timezone
 
-from flask import Blueprint, render_template, request, jsonify, current_app
+from flask import Blueprint, render_template, request, current_app, Response
+from sqlalchemy import lambda_stmt, select
+
+try:
+    import orjson
+except ImportError:          # pragma: no cover - orjson is in requirements
+    orjson = None
+
 from app import db
 from app.models import Client, ChartEntry
 
-# ------------------- Blueprint -------------------
-charts_bp = Blueprint("charts", __name__)
+
+def _ojsonify(obj, status=200):
+    """jsonify replacement using orjson (3-5x faster, serializes datetimes natively)."""
+    if orjson is not None:
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(obj, separators=(",", ":"), default=str).encode()
+    return current_app.response_class(body, status=status, mimetype="application/json")
 
 # ------------------- constants -------------------
 EXPECTED_TABS = ['profile', 'measures', 'nutrition', 'communication']
@@ -19,794 +35,109 @@ DEFAULT_ROWS = {
     'communication': [{'comm_date': '', 'comm_type': '', 'comm_notes': ''}],
 }
 
-# ───────── Include KG/Tools in saved history rows ─────────
-HISTORY_FIELDS = ("Workout", "KG", "Tools", "Rings", "Notes")
-
-def _clean_workout_row(r: dict) -> dict:
-    """Keep only the fields we want in history, fill missing with ''."""
-    return {k: (r.get(k) or "") for k in HISTORY_FIELDS}
-
-
-# ───────── Workout Rev History: SAVE (includes KG & Tools) ─────────
-@charts_bp.post("/client/<client>/workout-rev-history/save")
-def save_workout_rev_history(client: str):
-    payload = request.get_json(silent=True) or {}
-    raw_rows = payload.get("rows") or []
-
-    # Normalize rows to include Workout, KG, Tools, Rings, Notes
-    snapshot_rows = [_clean_workout_row(r) for r in raw_rows]
-
-    snapshot_id = str(uuid4())
-    # Store UTC; render local with Jinja filter
-    label = datetime.now(timezone.utc).isoformat()
-
-    snapshot_doc = {
-        "meta": {
-            "snapshot_id": snapshot_id,
-            "type": "workout_rev",
-            "created_at": label,
-        },
-        "rows": snapshot_rows,
-    }
+# ---------- template folder detection ----------
+# One isdir() check at import time; no symlink resolution needed here.
+_pkg_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATES_DIR = os.path.join(_pkg_dir, "templates")
+if not os.path.isdir(os.path.join(TEMPLATES_DIR, "charts")):
+    TEMPLATES_DIR = os.path.join(_pkg_dir, "template")
 
-    entry = ChartEntry(
-        client_name=client,
-        sheet="workout_rev_history",
-        data=snapshot_doc,
-        created_at=datetime.now(timezone.utc),
-    )
-    db.session.add(entry)
-    db.session.commit()
+charts_bp = Blueprint(
+    "charts",
+    __name__,
+    url_prefix="/charts",
+    template_folder=TEMPLATES_DIR
+)
 
-    return jsonify(status="success", snapshot_id=snapshot_id, label=label)
 
+# ------------------- small helpers -------------------
+def _client_by_name(name):
+    """Client lookup via lambda_stmt so the compiled plan is reused."""
+    stmt = lambda_stmt(lambda: select(Client))
+    stmt += lambda s: s.where(Client.name == name)
+    return db.session.scalars(stmt).first()
 
-# ───────── Workout Rev History: VIEW (renders the template) ─────────
-@charts_bp.get("/client/<client>/workout-rev-history")
-def view_workout_rev_history(client: str):
-    # Pull all history docs for this client
-    entries = (
-        ChartEntry.query
-                  .filter_by(client_name=client, sheet="workout_rev_history")
-                  .order_by(ChartEntry.created_at.desc())
-                  .all()
-    )
 
-    history_entries = []
-    for e in entries:
-        doc = (e.data or {})
-        meta = doc.get("meta", {})
-        label = meta.get("created_at") or (
-            # Fallback to the DB timestamp if needed
-            (e.created_at.astimezone(timezone.utc).isoformat() if e.created_at else "")
-        )
-        history_entries.append({
-            "meta": {
-                "snapshot_id": meta.get("snapshot_id", ""),
-                "type": meta.get("type", "workout_rev"),
-            },
-            "label": label,          # UTC string, formatted in template with |format_est
-            "rows": doc.get("rows", [])
-        })
-
-    return render_template(
-        "charts/workout_rev_history.html",
-        client_name=client,
-        history_entries=history_entries,
-    )
+def _entries_by_sheet(client, sheet, newest_first=False):
+    """ChartEntry rows for (client, sheet) with a cached statement plan."""
+    stmt = lambda_stmt(lambda: select(ChartEntry))
+    stmt += lambda s: s.where(ChartEntry.client_name == client,
+                              ChartEntry.sheet == sheet)
+    if newest_first:
+        stmt += lambda s: s.order_by(ChartEntry.created_at.desc())
+    return db.session.scalars(stmt).all()
 
 
-# ───────── Workout Rev History: DELETE (portable across DBs) ─────────
-@charts_bp.post("/client/<client>/workout-rev-history/<snapshot_id>/delete")
-def delete_workout_rev_history(client: str, snapshot_id: str):
-    # Portable approach (SQLite/Postgres): fetch and match in Python
-    rows = (
-        ChartEntry.query
-                  .filter_by(client_name=client, sheet="workout_rev_history")
-                  .all()
-    )
-    target = None
-    for r in rows:
-        try:
-            if (r.data or {}).get("meta", {}).get("snapshot_id") == snapshot_id:
-                target = r
-                break
-        except Exception:
-            continue
+def _fallbacks():
+    """Lazily import the workout fallback blocks (see _fallbacks.py).
 
-    if not target:
-        return jsonify(status="not_found"), 404
+    Only client_chart / blocks.json need them, so workers that never serve
+    those routes skip building the ~30 block dicts at import time.
+    """
+    from . import _fallbacks as m
+    return m.WORKOUT_FALLBACKS
 
-    db.session.delete(target)
-    db.session.commit()
-    return jsonify(status="success")
-
-
-
-
-
-# ------------------- WORKOUT BLOCKS -------------------
-# ---- C1–C5 ----
-C1_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP", "Rings": "-", "Notes": ""},
-        {"Workout": "KNEES TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "PUSH LEGS", "Rings": "S", "Notes": ""},
-        {"Workout": "FROG", "Rings": "S", "Notes": ""},
-        {"Workout": "KICKS SIDE", "Rings": "I", "Notes": ""},
-        {"Workout": "KICK SIDE TURN", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE TRIANGLES", "Rings": "S+S", "Notes": ""},
-        {"Workout": "SIDE CIRCLES", "Rings": "S+S", "Notes": ""},
-        {"Workout": "1 LEG FROG", "Rings": "IOP", "Notes": ""},
-        {"Workout": "BENDING LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS BACK", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS ON KNEE", "Rings": "S", "Notes": ""},
-        {"Workout": "ARMS BACK/UP", "Rings": "S", "Notes": ""},
-        {"Workout": "BICEPS SEATED", "Rings": "I", "Notes": ""},
-        {"Workout": "ROW SEATED", "Rings": "I", "Notes": ""},
-        {"Workout": "TRICEPS OPP", "Rings": "Sop", "Notes": ""},
-    ],
-    "GK": []
-}
-C2_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP 90", "Rings": "-", "Notes": ""},
-        {"Workout": "ELBOW KNEES", "Rings": "S", "Notes": ""},
-        {"Workout": "BICYCLE", "Rings": "S", "Notes": ""},
-        {"Workout": "LEGS EXTENSION", "Rings": "S", "Notes": ""},
-        {"Workout": "CROSSED KICKS", "Rings": "Sop", "Notes": ""},
-        {"Workout": "1 LEG FROG UP/DOWN", "Rings": "Iop", "Notes": ""},
-        {"Workout": "SIDE BICYCLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE KICK CHEST", "Rings": "I", "Notes": ""},
-        {"Workout": "HIPS UP", "Rings": "-", "Notes": ""},
-        {"Workout": "1/2 KICKS BACK", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS ON KNEE STR.", "Rings": "I", "Notes": ""},
-        {"Workout": "1/2 KICKS ON KNEE", "Rings": "I", "Notes": ""},
-        {"Workout": "SHOULDER UP", "Rings": "-", "Notes": ""},
-        {"Workout": "ARMS LIFT L.D.", "Rings": "S", "Notes": ""},
-        {"Workout": "BACK BUTTERFLY SEAT", "Rings": "I", "Notes": ""},
-        {"Workout": "PUSH ARMS UP", "Rings": "S", "Notes": ""},
-    ], "GK": []
-}
-C3_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP ALT", "Rings": "-", "Notes": ""},
-        {"Workout": "KNEES TWIST STRAIGHT", "Rings": "S", "Notes": ""},
-        {"Workout": "DOUBLE KICKS TURN", "Rings": "S", "Notes": ""},
-        {"Workout": "FROGGY", "Rings": "S", "Notes": ""},
-        {"Workout": "DIAGONAL KICKS", "Rings": "I", "Notes": ""},
-        {"Workout": "LEGS EXTENSION ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "1/2 KICK SIDE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE BEND & EXTEND", "Rings": "I", "Notes": ""},
-        {"Workout": "SWAY", "Rings": "-", "Notes": ""},
-        {"Workout": "PELVIS UP", "Rings": "-", "Notes": ""},
-        {"Workout": "CIRCLES ON KNEE", "Rings": "I", "Notes": ""},
-        {"Workout": "1/2 TRIANGLES O.K.", "Rings": "I", "Notes": ""},
-        {"Workout": "BOXING", "Rings": "S", "Notes": ""},
-        {"Workout": "SIDE ARM TURN", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED ROW", "Rings": "Iop", "Notes": ""},
-        {"Workout": "TRIC OPP SEATED", "Rings": "Iop", "Notes": ""},
-    ], "GK": []
-}
-C4_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE KICKS", "Rings": "-", "Notes": ""},
-        {"Workout": "FETAL CHEST UP", "Rings": "-", "Notes": ""},
-        {"Workout": "DOUBLE PUSH LEGS", "Rings": "S", "Notes": ""},
-        {"Workout": "REVERSE BICYCLE", "Rings": "S", "Notes": ""},
-        {"Workout": "SIDE KICKS PUMP", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS SIDE TURN REV", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "1 LEG FROG OP/CL", "Rings": "Iop", "Notes": ""},
-        {"Workout": "CAT UP", "Rings": "-", "Notes": ""},
-        {"Workout": "BENDING LEGS ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS ON KNEE", "Rings": "s+s", "Notes": ""},
-        {"Workout": "BEND/EXTEND ON KNEE", "Rings": "I", "Notes": ""},
-        {"Workout": "SHOULDER ELBOW B.D.", "Rings": "S", "Notes": ""},
-        {"Workout": "SIDE CIRCLES", "Rings": "S", "Notes": ""},
-        {"Workout": "ARMS LIFT", "Rings": "S", "Notes": ""},
-        {"Workout": "BICEPS TWIST", "Rings": "Iop", "Notes": ""},
-    ], "GK": []
-}
-C5_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "DOUBLE KICKS TURN REV", "Rings": "S", "Notes": ""},
-        {"Workout": "ALT FROG", "Rings": "S", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "TRIANGLES ON STOM", "Rings": "I", "Notes": ""},
-        {"Workout": "1/2 CIRCLES ON KNEE", "Rings": "I", "Notes": ""},
-        {"Workout": "TRIANGLES ON KNEE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS OPP", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-    ], "GK": []
-}
 
-# ---- V1–V5 ----
-V1_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP", "Rings": "-", "Notes": ""},
-        {"Workout": "KNEES TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "PUSH LEGS", "Rings": "S", "Notes": ""},
-        {"Workout": "FROG", "Rings": "S", "Notes": ""},
-        {"Workout": "BICYCLE", "Rings": "S", "Notes": ""},
-        {"Workout": "HIPS UP", "Rings": "-", "Notes": ""},
-        {"Workout": "KICKS UP", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS SIDE", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS SIDE TURN", "Rings": "I", "Notes": ""},
-        {"Workout": "BENDING LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS BACK", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS ON KNEE", "Rings": "S", "Notes": ""},
-        {"Workout": "ARMS BACK/UP", "Rings": "S", "Notes": ""},
-        {"Workout": "BICEPS SEATED", "Rings": "I", "Notes": ""},
-        {"Workout": "ROW SEATED", "Rings": "I", "Notes": ""},
-        {"Workout": "TRICEPS OPP", "Rings": "Sop", "Notes": ""},
-    ], "GK": []
-}
-V2_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP 90", "Rings": "-", "Notes": ""},
-        {"Workout": "ELBOW KNEES", "Rings": "S", "Notes": ""},
-        {"Workout": "SCISSORS", "Rings": "S", "Notes": ""},
-        {"Workout": "EAGLE", "Rings": "S", "Notes": ""},
-        {"Workout": "SWAY", "Rings": "-", "Notes": ""},
-        {"Workout": "STOMACH UP/DOWN", "Rings": "-", "Notes": ""},
-        {"Workout": "KNEES TO CHEST", "Rings": "I", "Notes": ""},
-        {"Workout": "LEGS EXTENSION", "Rings": "S", "Notes": ""},
-        {"Workout": "SIDE TRIANGLES", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS ON KNEE STR", "Rings": "I", "Notes": ""},
-        {"Workout": "1/2 KICKS ON KNEE", "Rings": "I", "Notes": ""},
-        {"Workout": "SHOULDER UP", "Rings": "-", "Notes": ""},
-        {"Workout": "ARMS LIFT L.D.", "Rings": "S", "Notes": ""},
-        {"Workout": "BACK BUTTERFLY SEAT", "Rings": "I", "Notes": ""},
-        {"Workout": "PUSH ARMS UP", "Rings": "S", "Notes": ""},
-    ], "GK": []
-}
-V3_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP ALT", "Rings": "-", "Notes": ""},
-        {"Workout": "REVERSE CRUNCH", "Rings": "-", "Notes": ""},
-        {"Workout": "KNEES TWIST STRAIGHT", "Rings": "S", "Notes": ""},
-        {"Workout": "ELBOW KNEE STS", "Rings": "I", "Notes": ""},
-        {"Workout": "KICK UP TOUCH", "Rings": "I", "Notes": ""},
-        {"Workout": "LATERAL KICKS (inner)", "Rings": "I", "Notes": ""},
-        {"Workout": "STOMACH TRIANGLES", "Rings": "-", "Notes": ""},
-        {"Workout": "1/2 KICK SIDE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE BEND & EXTEND", "Rings": "I", "Notes": ""},
-        {"Workout": "CHEST LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "BOXING", "Rings": "S", "Notes": ""},
-        {"Workout": "SIDE ARM TURN", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED ROW", "Rings": "Iop", "Notes": ""},
-        {"Workout": "TRIC OPP SEATED", "Rings": "Iop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ], "GK": []
-}
-V4_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE KICKS", "Rings": "-", "Notes": ""},
-        {"Workout": "FETAL CHEST UP", "Rings": "-", "Notes": ""},
-        {"Workout": "ELBOW KNEES", "Rings": "S", "Notes": ""},
-        {"Workout": "REVERSE EAGLE", "Rings": "S", "Notes": ""},
-        {"Workout": "SCISSORS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST U", "Rings": "I", "Notes": ""},
-        {"Workout": "CAT UP", "Rings": "-", "Notes": ""},
-        {"Workout": "CLIMBER", "Rings": "-", "Notes": ""},
-        {"Workout": "KICKS SIDE TURN REV", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE CIRCLES ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "KICK DIAGONAL COMPL", "Rings": "I", "Notes": ""},
-        {"Workout": "SHOULDER ELBOW B.D.", "Rings": "S", "Notes": ""},
-        {"Workout": "ARMS LIFT", "Rings": "S", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ], "GK": []
-}
-V5_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ], "GK": []
-}
+_FALSY = frozenset(('', 'no', 'false', '0', 'off', 'none'))
 
-# ---- TO1–TO5 ----
-TO1_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP", "Rings": "-", "Notes": ""},
-        {"Workout": "KNEES TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "SCISSORS", "Rings": "S", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "S", "Notes": ""},
-        {"Workout": "EAGLE", "Rings": "S", "Notes": ""},
-        {"Workout": "HIPS UP", "Rings": "-", "Notes": ""},
-        {"Workout": "KICKS UP", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS SIDE", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS SIDE TURN", "Rings": "I", "Notes": ""},
-        {"Workout": "SUPERWOMAN", "Rings": "ALL", "Notes": ""},
-        {"Workout": "BODY TWIST", "Rings": "Sop", "Notes": ""},
-        {"Workout": "ARMS BACK/UP", "Rings": "S", "Notes": ""},
-        {"Workout": "BICEPS SEATED", "Rings": "I", "Notes": ""},
-        {"Workout": "ROW SEATED", "Rings": "I", "Notes": ""},
-        {"Workout": "TRICEPS OPP", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ],
-}
-TO2_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP 90", "Rings": "-", "Notes": ""},
-        {"Workout": "1 LEG TWIST", "Rings": "I", "Notes": ""},
-        {"Workout": "HIPS SIDE TO SIDE", "Rings": "I", "Notes": ""},
-        {"Workout": "ELBOW KNEE (feet down)", "Rings": "-", "Notes": ""},
-        {"Workout": "SWAY", "Rings": "-", "Notes": ""},
-        {"Workout": "STOMACH UP/DOWN", "Rings": "-", "Notes": ""},
-        {"Workout": "KNEES TO CHEST", "Rings": "I", "Notes": ""},
-        {"Workout": "KICKS DIAGONAL", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE TRIANGLES", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "HIPS SIDE TO SIDE BD", "Rings": "I", "Notes": ""},
-        {"Workout": "SHOULDER UP", "Rings": "-", "Notes": ""},
-        {"Workout": "ARMS LIFT L.D.", "Rings": "S", "Notes": ""},
-        {"Workout": "BACK BUTTERFLY SEAT", "Rings": "I", "Notes": ""},
-        {"Workout": "PUSH ARMS UP", "Rings": "S", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ],
-}
-TO3_BLOCK = {
-    "rows": [
-        {"Workout": "CHEST UP ALT", "Rings": "-", "Notes": ""},
-        {"Workout": "REVERSE CRUNCH", "Rings": "-", "Notes": ""},
-        {"Workout": "KNEES TWIST STRAIGHT", "Rings": "S", "Notes": ""},
-        {"Workout": "KICK UP ALT", "Rings": "S", "Notes": ""},
-        {"Workout": "ELBOW KNEE STS", "Rings": "I", "Notes": ""},
-        {"Workout": "KICK UP TOUCH", "Rings": "I", "Notes": ""},
-        {"Workout": "LATERAL KICKS (inner)", "Rings": "I", "Notes": ""},
-        {"Workout": "STOMACH TRIANGLES", "Rings": "-", "Notes": ""},
-        {"Workout": "1/2 KICK SIDE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE BEND & EXTEND", "Rings": "I", "Notes": ""},
-        {"Workout": "CHEST LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "BOXING", "Rings": "S", "Notes": ""},
-        {"Workout": "SIDE ARM TURN", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED ROW", "Rings": "Iop", "Notes": ""},
-        {"Workout": "TRIC OPP SEATED", "Rings": "Iop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ],
-    }
-TO4_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE KICKS", "Rings": "-", "Notes": ""},
-        {"Workout": "FETAL CHEST UP", "Rings": "-", "Notes": ""},
-        {"Workout": "ELBOW KNEES", "Rings": "S", "Notes": ""},
-        {"Workout": "REVERSE EAGLE", "Rings": "S", "Notes": ""},
-        {"Workout": "SCISSORS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST U", "Rings": "I", "Notes": ""},
-        {"Workout": "CAT UP", "Rings": "-", "Notes": ""},
-        {"Workout": "CLIMBER", "Rings": "-", "Notes": ""},
-        {"Workout": "KICKS SIDE TURN REV", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE CIRCLES ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "KICK DIAGONAL COMPL", "Rings": "I", "Notes": ""},
-        {"Workout": "SHOULDER ELBOW B.D.", "Rings": "S", "Notes": ""},
-        {"Workout": "ARMS LIFT", "Rings": "S", "Notes": ""},
-        {"Workout": "BICEPS TWIST", "Rings": "Iop", "Notes": ""},
-        {"Workout": "ARMS LIFT", "Rings": "S", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ],
 
-    }
-TO5_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B1_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B2_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B3_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B4_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B5_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B6_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B7_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B8_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B9_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B10_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B11_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-B12_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-
-B13_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-
-B14_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-
-B15_BLOCK = {
-    "rows": [
-        {"Workout": "DOUBLE TWIST", "Rings": "-", "Notes": ""},
-        {"Workout": "CHEST UP 3 90", "Rings": "-", "Notes": ""},
-        {"Workout": "FEET KICKS & CIRCLES", "Rings": "I", "Notes": ""},
-        {"Workout": "CROSSED LEGS", "Rings": "I", "Notes": ""},
-        {"Workout": "KNEES TO CHEST ALT", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE LEGS LIFT", "Rings": "-", "Notes": ""},
-        {"Workout": "HIPS SEMICIRCLE", "Rings": "-", "Notes": ""},
-        {"Workout": "INNER THIGHS", "Rings": "I+I", "Notes": ""},
-        {"Workout": "SIDE 1/2 TRIANGLE", "Rings": "I", "Notes": ""},
-        {"Workout": "SIDE PUSH", "Rings": "Sop", "Notes": ""},
-        {"Workout": "CHEST LIFT U", "Rings": "-", "Notes": ""},
-        {"Workout": "SIDE ARM BACK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "BICEPS DIAGONAL", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ARMS UP SEATED", "Rings": "S/I", "Notes": ""},
-        {"Workout": "CROSS ROW OK", "Rings": "Sop", "Notes": ""},
-        {"Workout": "", "Rings": "", "Notes": ""},
-    ]
-   }
-
-
-# Collect all blocks for template / JSON use
-WORKOUT_FALLBACKS = {
-    "C1": C1_BLOCK, "C2": C2_BLOCK, "C3": C3_BLOCK, "C4": C4_BLOCK, "C5": C5_BLOCK,
-    "V1": V1_BLOCK, "V2": V2_BLOCK, "V3": V3_BLOCK, "V4": V4_BLOCK, "V5": V5_BLOCK,
-    "TO1": TO1_BLOCK, "TO2": TO2_BLOCK, "TO3": TO3_BLOCK, "TO4": TO4_BLOCK, "TO5": TO5_BLOCK, 
-    "B1": B1_BLOCK, "B2": B2_BLOCK, "B3": B3_BLOCK, "B4": B4_BLOCK, "B5": B5_BLOCK, "B6": B6_BLOCK, "B7": B7_BLOCK, 
-    "B8": B8_BLOCK, "B9": B9_BLOCK, "B10": B10_BLOCK, "B11": B11_BLOCK, "B12": B12_BLOCK, "B13": B13_BLOCK, "B14": B14_BLOCK, "B15": B15_BLOCK
-}
+def _truthy(val) -> bool:
+    if val is True:
+        return True
+    if val is False or val is None:
+        return False
+    if isinstance(val, (int, float)):
+        return val != 0
+    return str(val).strip().lower() not in _FALSY
 
 
-# ---------- template folder detection ----------
-_here = Path(__file__).resolve()
-TEMPLATES_DIR = (_here.parent.parent / "templates").resolve()
-if not (TEMPLATES_DIR / "charts").exists():
-    TEMPLATES_DIR = (_here.parent.parent / "template").resolve()
+# Small per-process memo for the sidebar flags. Saves to the profile
+# sheet invalidate it; the TTL covers writes from other workers.
+_QUICK_FLAGS_TTL = 60  # seconds
+_quick_flags_cache = {}
 
-charts_bp = Blueprint(
-    "charts",
-    __name__,
-    url_prefix="/charts",
-    template_folder=str(TEMPLATES_DIR)
-)
 
-
-# ------------------- small helpers -------------------
-def _truthy(val) -> bool:
-    if isinstance(val, bool):
-        return val
-    s = str(val or '').strip().lower()
-    return s not in ('', 'no', 'false', '0', 'off', 'none')
+def _invalidate_quick_flags():
+    _quick_flags_cache.clear()
 
 
 def _bulk_quick_flags(client_names):
-    flags = {name: {'nutrition': False, 'focus': False} for name in client_names}
     if not client_names:
-        return flags
+        return {}
+    key = frozenset(client_names)
+    hit = _quick_flags_cache.get(key)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < _QUICK_FLAGS_TTL:
+        return hit[1]
+    flags = {name: {'nutrition': False, 'focus': False} for name in client_names}
     try:
-        rows = (ChartEntry.query
-                .filter(ChartEntry.client_name.in_(client_names),
-                        ChartEntry.sheet == 'profile')
-                .order_by(ChartEntry.created_at.desc())
+        # One statement: newest row per (client, field), picked by the DB.
+        # row_number() is portable (SQLite/Postgres); DISTINCT ON is PG-only.
+        field = db.func.trim(ChartEntry.data['Field'].as_string()).label('field')
+        value = db.func.coalesce(
+            db.func.nullif(ChartEntry.data['Flag'].as_string(), ''),
+            ChartEntry.data['Value'].as_string(),
+        ).label('value')
+        rn = (db.func.row_number()
+              .over(partition_by=(ChartEntry.client_name, field),
+                    order_by=ChartEntry.created_at.desc())
+              .label('rn'))
+        sub = (db.session.query(ChartEntry.client_name.label('client_name'),
+                                field, value, rn)
+               .filter(ChartEntry.client_name.in_(client_names),
+                       ChartEntry.sheet == 'profile',
+                       field.in_(('Nutrition Flag', 'Focus Case Flag')))
+               .subquery())
+        rows = (db.session.query(sub.c.client_name, sub.c.field, sub.c.value)
+                .filter(sub.c.rn == 1)
                 .all())
-        seen = {name: {'nutrition': False, 'focus': False} for name in client_names}
-        for ent in rows:
-            data = ent.data or {}
-            field = (data.get('Field') or '').strip()
-            if ent.client_name not in flags:
-                continue
-            if field == 'Nutrition Flag' and not seen[ent.client_name]['nutrition']:
-                flags[ent.client_name]['nutrition'] = _truthy(data.get('Flag') or data.get('Value'))
-                seen[ent.client_name]['nutrition'] = True
-            elif field == 'Focus Case Flag' and not seen[ent.client_name]['focus']:
-                flags[ent.client_name]['focus'] = _truthy(data.get('Flag') or data.get('Value'))
-                seen[ent.client_name]['focus'] = True
+        for name, fld, val in rows:
+            if name in flags:
+                which = 'nutrition' if fld == 'Nutrition Flag' else 'focus'
+                flags[name][which] = _truthy(val)
+        if len(_quick_flags_cache) > 128:
+            _quick_flags_cache.clear()
+        _quick_flags_cache[key] = (now, flags)
     except Exception as e:
         current_app.logger.error(f"[charts/_bulk_quick_flags] {e}")
     return flags
@@ -820,8 +151,43 @@ def _rows_from_sheet_obj(sheet_obj):
     return None
 
 
+def _dedup_mappings(client, sheet, rows, keep=None):
+    """Build insert mappings, dropping exact duplicate rows.
+
+    Clients that re-send full snapshots often include identical rows;
+    hashing a key-sorted JSON dump is far cheaper than storing and
+    re-reading them forever. Blank filler rows (all-empty values, used
+    to pad the workout grids) are kept as-is.
+    """
+    seen = set()
+    mappings = []
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        if keep is not None and not keep(row):
+            continue
+        if any(row.values()):
+            if orjson is not None:
+                digest = orjson.dumps(row, option=orjson.OPT_SORT_KEYS)
+            else:
+                digest = json.dumps(row, sort_keys=True, default=str)
+            digest = hashlib.blake2b(
+                digest if isinstance(digest, bytes) else digest.encode(),
+                digest_size=16,
+            ).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+        mappings.append({'client_name': client, 'sheet': sheet, 'data': row})
+    return mappings
+
+
+M_FIELD_PREFIXES = ('M0:', 'M2:', 'M3:')
+
+
 def _is_m_field(val: str) -> bool:
-    return isinstance(val, str) and (val.startswith('M0:') or val.startswith('M2:') or val.startswith('M3:'))
+    # Tuple form of startswith: one C-level call instead of three.
+    return isinstance(val, str) and val.startswith(M_FIELD_PREFIXES)
 
 
 def _utc_iso(dt: datetime | None = None) -> str:
@@ -843,35 +209,48 @@ def view_charts():
     filter_applied = False
     try:
         if filter_client and not filter_status:
-            c = Client.query.filter_by(name=filter_client).first()
+            c = _client_by_name(filter_client)
             if c and c.status:
                 filter_status = c.status.strip()
 
         q = Client.query
         if filter_status:
             filter_applied = True
-            q = q.filter(db.func.lower(Client.status) == filter_status.lower())
-
-        clients = q.order_by(Client.created_at).all()
+            # Equality on the indexed, pre-normalized column — no LOWER()
+            # over every row.
+            q = q.filter(Client.status_key == filter_status.casefold())
+
+        # Column tuples instead of full ORM instances — we only read five
+        # scalar attrs, so skip identity-map/loader bookkeeping per row.
+        rows = list(
+            q.with_entities(Client.name, Client.created_at, Client.status,
+                            Client.email, Client.phone)
+             .order_by(Client.created_at)
+             .yield_per(500)
+        )
 
-        names = [c.name for c in clients]
+        names = [r[0] for r in rows]
         flags_map = _bulk_quick_flags(names)
 
         columns = ['Name', 'Date Created', 'Status', 'Email', 'Phone']
-        data = []
-        for c in clients:
-            f = flags_map.get(c.name, {'nutrition': False, 'focus': False})
-            data.append({
-                'Name': c.name,
-                'Date Created': c.created_at.strftime('%Y-%m-%d') if c.created_at else '',
-                'Status': c.status,
-                'Email': c.email or '',
-                'Phone': c.phone or '',
-                'Nutrition Flag': 'Yes' if f.get('nutrition') else 'No',
-                'Focus Case Flag': 'Yes' if f.get('focus') else 'No',
-                'nutrition_flag': f.get('nutrition'),
-                'focus_flag': f.get('focus'),
-            })
+        # Comprehension with hoisted locals keeps the hot loop free of
+        # repeated LOAD_GLOBAL/LOAD_ATTR work.
+        default_flags = {'nutrition': False, 'focus': False}
+        fmap_get = flags_map.get
+        data = [
+            {
+                'Name': name,
+                'Date Created': created_at.strftime('%Y-%m-%d') if created_at else '',
+                'Status': status,
+                'Email': email or '',
+                'Phone': phone or '',
+                'Nutrition Flag': 'Yes' if (f := fmap_get(name, default_flags))['nutrition'] else 'No',
+                'Focus Case Flag': 'Yes' if f['focus'] else 'No',
+                'nutrition_flag': f['nutrition'],
+                'focus_flag': f['focus'],
+            }
+            for name, created_at, status, email, phone in rows
+        ]
 
         return render_template(
             "charts/charts.html",
@@ -893,31 +272,32 @@ def view_charts():
 def client_chart(client):
     """Render the client card partial (+ blocks json for Rev1)."""
     try:
-        client_obj = Client.query.filter_by(name=client).first()
+        client_obj = _client_by_name(client)
         client_status = (client_obj.status if client_obj and client_obj.status else '').strip()
 
-        sheets = {}
+        # One round-trip for all tabs (incl. the editable workout_rev1 grid)
+        # instead of one query per sheet; bucket the rows in Python.
+        wanted = EXPECTED_TABS + ['workout_rev1']
+        rows = (ChartEntry.query
+                .with_entities(ChartEntry.sheet, ChartEntry.data)
+                .filter(ChartEntry.client_name == client,
+                        ChartEntry.sheet.in_(wanted))
+                .order_by(ChartEntry.sheet, ChartEntry.created_at)
+                .all())
+
+        sheets = {tab: {'data': []} for tab in wanted}
+        for sheet, data in rows:
+            sheets[sheet]['data'].append(data)
         for tab in EXPECTED_TABS:
-            entries = (ChartEntry.query
-                       .filter_by(client_name=client, sheet=tab)
-                       .order_by(ChartEntry.created_at)
-                       .all())
-            data = [e.data for e in entries] if entries else DEFAULT_ROWS.get(tab, [])
-            sheets[tab] = {'data': data}
-
-        # Include latest "workout_rev1" grid (current editable state)
-        rev1_entries = (ChartEntry.query
-                        .filter_by(client_name=client, sheet='workout_rev1')
-                        .order_by(ChartEntry.created_at)
-                        .all())
-        sheets['workout_rev1'] = {'data': [e.data for e in rev1_entries] if rev1_entries else []}
+            if not sheets[tab]['data']:
+                sheets[tab]['data'] = DEFAULT_ROWS.get(tab, [])
 
         return render_template(
             "charts/_client_form.html",
             client=client,
             client_status=client_status,
             sheets=sheets,
-            workout_blocks_json=WORKOUT_FALLBACKS
+            workout_blocks_json=_fallbacks()
         )
     except Exception as e:
         current_app.logger.error(f"[client_chart/{client}] {e}")
@@ -928,10 +308,10 @@ def client_chart(client):
 def blocks_json():
     """Fallback JSON endpoint so the UI can fetch plans even if scripts/templates are stripped."""
     try:
-        return jsonify({"blocks": WORKOUT_FALLBACKS}), 200
+        return _ojsonify({"blocks": _fallbacks()}, status=200)
     except Exception as e:
         current_app.logger.error(f"[blocks_json] {e}")
-        return jsonify({"blocks": {}}), 200
+        return _ojsonify({"blocks": {}}, status=200)
 
 
 @charts_bp.route("/client/<client>/save", methods=["POST"])
@@ -945,50 +325,59 @@ def save_client_chart(client):
       or
       { "<tab>": [...], "<tab2>": [...] }  (direct)
     """
-    # Parse JSON
-    try:
-        payload = request.get_json(force=True) or {}
-    except Exception as e:
-        current_app.logger.error(f"[save_client_chart] JSON error: {e}")
-        return jsonify(status='error', message='Invalid JSON'), 400
+    # Parse JSON once; silent=True avoids the raise/catch dance and the
+    # body is only buffered a single time (cache=True is the default).
+    payload = request.get_json(force=True, silent=True)
+    if payload is None:
+        current_app.logger.error(f"[save_client_chart/{client}] Invalid JSON body")
+        return _ojsonify({"status": 'error', "message": 'Invalid JSON'}, status=400)
 
     # Single-section fast path
     if isinstance(payload, dict) and 'section' in payload:
         section = str(payload.get('section', '')).lower().strip()
         rows = payload.get('data') or []
         if section not in EXPECTED_TABS and section != 'workout_rev1':
-            return jsonify(status='error', message=f"Unknown section '{section}'"), 400
+            return _ojsonify({"status": 'error', "message": f"Unknown section '{section}'"}, status=400)
         if not isinstance(rows, list):
-            return jsonify(status='error', message='`data` must be a list'), 400
+            return _ojsonify({"status": 'error', "message": '`data` must be a list'}, status=400)
 
         try:
             if section == 'measures':
-                existing = ChartEntry.query.filter_by(client_name=client, sheet='measures').all()
-                for ent in existing:
-                    field = (ent.data or {}).get('Field', '') or ''
-                    if _is_m_field(field):
-                        db.session.delete(ent)
-                inserted = 0
-                for row in rows:
-                    if isinstance(row, dict) and _is_m_field(row.get('Field', '')):
-                        db.session.add(ChartEntry(client_name=client, sheet='measures', data=row))
-                        inserted += 1
+                # Bulk DELETE of M-block rows in SQL — no row hydration,
+                # one statement instead of per-row deletes.
+                with db.session.no_autoflush:
+                    db.session.execute(
+                        db.delete(ChartEntry)
+                        .where(ChartEntry.client_name == client,
+                               ChartEntry.sheet == 'measures',
+                               db.func.substr(ChartEntry.data['Field'].as_string(), 1, 3)
+                                 .in_(M_FIELD_PREFIXES))
+                        .execution_options(synchronize_session=False)
+                    )
+                    mappings = _dedup_mappings(
+                        client, 'measures', rows,
+                        keep=lambda r: _is_m_field(r.get('Field', '')),
+                    )
+                    if mappings:
+                        # Core executemany: one multi-valued INSERT on PG
+                        db.session.execute(ChartEntry.__table__.insert(), mappings)
                 db.session.commit()
-                return jsonify(status='success', mode='partial', sheet='measures', inserted=inserted), 200
+                return _ojsonify({"status": 'success', "mode": 'partial', "sheet": 'measures', "inserted": len(mappings)}, status=200)
 
             # Replace section entirely
-            ChartEntry.query.filter_by(client_name=client, sheet=section).delete(synchronize_session=False)
-            inserted = 0
-            for row in rows:
-                if isinstance(row, dict):
-                    db.session.add(ChartEntry(client_name=client, sheet=section, data=row))
-                    inserted += 1
+            with db.session.no_autoflush:
+                ChartEntry.query.filter_by(client_name=client, sheet=section).delete(synchronize_session=False)
+                mappings = _dedup_mappings(client, section, rows)
+                if mappings:
+                    db.session.execute(ChartEntry.__table__.insert(), mappings)
             db.session.commit()
-            return jsonify(status='success', mode='replace', sheet=section, inserted=inserted), 200
+            if section == 'profile':
+                _invalidate_quick_flags()
+            return _ojsonify({"status": 'success', "mode": 'replace', "sheet": section, "inserted": len(mappings)}, status=200)
         except Exception as e:
             db.session.rollback()
             current_app.logger.error(f"[save_client_chart/{client}] {e}")
-            return jsonify(status='error', message='Database error'), 500
+            return _ojsonify({"status": 'error', "message": 'Database error'}, status=500)
 
     # ---------- BULK SAVE ----------
     # Accept either {"sheets": {...}} or directly {...}
@@ -998,7 +387,7 @@ def save_client_chart(client):
         sheets_payload = payload
 
     if not isinstance(sheets_payload, dict):
-        return jsonify(status='error', message='Invalid payload root'), 400
+        return _ojsonify({"status": 'error', "message": 'Invalid payload root'}, status=400)
 
     # Validate & normalize
     parsed = {}
@@ -1012,22 +401,25 @@ def save_client_chart(client):
         parsed[sheet] = rows
 
     if not parsed:
-        return jsonify(status='error', message='No valid sheets to save'), 400
+        return _ojsonify({"status": 'error', "message": 'No valid sheets to save'}, status=400)
 
     try:
         total = 0
-        for sheet, rows in parsed.items():
-            ChartEntry.query.filter_by(client_name=client, sheet=sheet).delete(synchronize_session=False)
-            for row in rows:
-                if isinstance(row, dict):
-                    db.session.add(ChartEntry(client_name=client, sheet=sheet, data=row))
-                    total += 1
+        with db.session.no_autoflush:
+            for sheet, rows in parsed.items():
+                ChartEntry.query.filter_by(client_name=client, sheet=sheet).delete(synchronize_session=False)
+                mappings = _dedup_mappings(client, sheet, rows)
+                if mappings:
+                    db.session.execute(ChartEntry.__table__.insert(), mappings)
+                total += len(mappings)
         db.session.commit()
-        return jsonify(status='success', mode='bulk', saved=total, sheets=list(parsed.keys())), 200
+        if 'profile' in parsed:
+            _invalidate_quick_flags()
+        return _ojsonify({"status": 'success', "mode": 'bulk', "saved": total, "sheets": list(parsed.keys())}, status=200)
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"[save_client_chart bulk/{client}] {e}")
-        return jsonify(status='error', message='Database error'), 500
+        return _ojsonify({"status": 'error', "message": 'Database error'}, status=500)
 
 
 
@@ -1044,11 +436,10 @@ def workout_rev1_submit(client):
         "gk_rows": [...]  // optional, if present
       }
     """
-    try:
-        data = request.get_json(force=True) or {}
-    except Exception as e:
-        current_app.logger.error(f"[workout_rev1_submit/{client}] JSON error: {e}")
-        return jsonify(status='error', message='Invalid JSON'), 400
+    data = request.get_json(force=True, silent=True)
+    if data is None:
+        current_app.logger.error(f"[workout_rev1_submit/{client}] Invalid JSON body")
+        return _ojsonify({"status": 'error', "message": 'Invalid JSON'}, status=400)
 
     rows         = data.get("rows") or []
     gk_rows      = data.get("gk_rows") or []
@@ -1057,7 +448,7 @@ def workout_rev1_submit(client):
     program_type = (data.get("program_type") or "").strip()
 
     if not isinstance(rows, list):
-        return jsonify(status='error', message='`rows` must be a list'), 400
+        return _ojsonify({"status": 'error', "message": '`rows` must be a list'}, status=400)
 
     # ---- 1) Replace the current editable grid (sheet='workout_rev1') ----
     try:
@@ -1069,7 +460,7 @@ def workout_rev1_submit(client):
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"[workout_rev1_submit replace/{client}] {e}")
-        return jsonify(status='error', message='Failed to save current grid'), 500
+        return _ojsonify({"status": 'error', "message": 'Failed to save current grid'}, status=500)
 
     # ---- 2) Build per-row data INCLUDING KG & Tools (defaults from toolbar) ----
     def _merge(r: dict) -> dict:
@@ -1105,11 +496,11 @@ def workout_rev1_submit(client):
     try:
         db.session.add(ChartEntry(client_name=client, sheet='workout_rev1_history', data=snapshot))
         db.session.commit()
-        return jsonify(status='success', snapshot=snapshot), 200
+        return _ojsonify({"status": 'success', "snapshot": snapshot}, status=200)
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"[workout_rev1_submit snapshot/{client}] {e}")
-        return jsonify(status='error', message='Failed to create history snapshot'), 500
+        return _ojsonify({"status": 'error', "message": 'Failed to create history snapshot'}, status=500)
 
 
 @charts_bp.route("/client/<client>/workout-rev-history.json", methods=["GET"])
@@ -1119,10 +510,7 @@ def workout_rev_history_json(client):
     Each item includes: snapshot_id, snapshot_at, kg, tools, program_type, rows.
     """
     try:
-        entries = (ChartEntry.query
-                   .filter_by(client_name=client, sheet='workout_rev1_history')
-                   .order_by(ChartEntry.created_at.desc())
-                   .all())
+        entries = _entries_by_sheet(client, 'workout_rev1_history', newest_first=True)
 
         snapshots = []
         for ent in entries:
@@ -1138,20 +526,17 @@ def workout_rev_history_json(client):
                 "rows": d.get("rows", []),
             })
 
-        return jsonify(status='success', snapshots=snapshots, count=len(snapshots)), 200
+        return _ojsonify({"status": 'success', "snapshots": snapshots, "count": len(snapshots)}, status=200)
     except Exception as e:
         current_app.logger.error(f"[workout_rev_history_json/{client}] {e}")
-        return jsonify(status='error', message='Failed to load history'), 500
+        return _ojsonify({"status": 'error', "message": 'Failed to load history'}, status=500)
 
 
 # (Optional) Keep a simple HTML history page (handy for direct link or debugging)
 @charts_bp.route("/client/<client>/workout-rev-history", methods=["GET"], endpoint="workout_rev_history")
 def workout_rev_history_page(client):
     try:
-        entries = (ChartEntry.query
-                   .filter_by(client_name=client, sheet='workout_rev1_history')
-                   .order_by(ChartEntry.created_at.desc())
-                   .all())
+        entries = _entries_by_sheet(client, 'workout_rev1_history', newest_first=True)
 
         history_entries = []
         for ent in entries:
@@ -1196,11 +581,11 @@ def clear_workout_rev1(client: str):
                 data={"Workout": "", "Rings": "", "Notes": ""}
             ))
         db.session.commit()
-        return jsonify(status="success"), 200
+        return _ojsonify({"status": "success"}, status=200)
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"[clear_workout_rev1/{client}] {e}")
-        return jsonify(status="error", message="Failed to clear"), 500
+        return _ojsonify({"status": "error", "message": "Failed to clear"}, status=500)
 
 
 
@@ -1214,9 +599,7 @@ def delete_workout_rev_history(client, snapshot_id):
     - For older rows that may not have snapshot_id, we fall back to the row's DB id.
     """
     try:
-        candidates = (ChartEntry.query
-                      .filter_by(client_name=client, sheet='workout_rev1_history')
-                      .all())
+        candidates = _entries_by_sheet(client, 'workout_rev1_history')
 
         target = None
         for ent in candidates:
@@ -1227,30 +610,50 @@ def delete_workout_rev_history(client, snapshot_id):
                 break
 
         if not target:
-            return jsonify(status="error", message="Snapshot not found"), 404
+            return _ojsonify({"status": "error", "message": "Snapshot not found"}, status=404)
 
         db.session.delete(target)
         db.session.commit()
-        return jsonify(status="success", deleted=1, snapshot_id=snapshot_id), 200
+        return _ojsonify({"status": "success", "deleted": 1, "snapshot_id": snapshot_id}, status=200)
 
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"[delete_workout_rev_history/{client}] {e}")
-        return jsonify(status="error", message="Failed to delete snapshot"), 500
+        return _ojsonify({"status": "error", "message": "Failed to delete snapshot"}, status=500)
 
 
 # ───────────────── GK (Goldorack) row order: LOAD ─────────────────
+# Pre-serialized "nothing saved yet" response — the common case.
+_EMPTY_ORDER = b'{"order":[]}'
+
+
+@lru_cache(maxsize=512)
+def _gk_order_bytes(row_id):
+    """Serialize the saved GK order once per row.
+
+    No column makes a safe cache key on its own — created_at's SQLite
+    func.now() default has 1-second resolution, and SQLite reuses the
+    deleted row's id on the replace-style upsert — so the save route
+    calls cache_clear() instead. Writes are rare; reads hit the cache.
+    """
+    row = ChartEntry.query.get(row_id)
+    data = row.data if row and isinstance(row.data, dict) else {}
+    return json.dumps({"order": data.get("order", [])}, separators=(",", ":")).encode()
+
+
 @charts_bp.route("/client/<client>/gk-order.json", methods=["GET"])
 def charts_get_gk_order(client):
     """Return saved GK row order for this client."""
     row = (
         ChartEntry.query
+        .with_entities(ChartEntry.id)
         .filter_by(client_name=client, sheet="gk_order")
-        .order_by(ChartEntry.created_at.desc())
+        .order_by(ChartEntry.id.desc())
         .first()
     )
-    data = row.data if row and isinstance(row.data, dict) else {}
-    return jsonify({"order": data.get("order", [])})
+    if row is None:
+        return Response(_EMPTY_ORDER, mimetype="application/json")
+    return Response(_gk_order_bytes(row.id), mimetype="application/json")
 
 # ───────────────── GK (Goldorack) row order: SAVE ─────────────────
 @charts_bp.route("/client/<client>/gk-order", methods=["POST"])
@@ -1266,4 +669,7 @@ def charts_save_gk_order(client):
         data={"order": order, "saved_at": datetime.now(timezone.utc).isoformat()}
     ))
     db.session.commit()
-    return jsonify({"ok": True})
+    # Drop cached serializations — rapid saves can land with the same
+    # created_at second and even the same reused row id.
+    _gk_order_bytes.cache_clear()
+    return _ojsonify({"ok": True})
@@ -1,40 +1,69 @@
 # File: app/clients/routes.py
 
-import pandas as pd
+import threading
 from datetime import datetime
-from flask import Blueprint, render_template, redirect, url_for, flash
+from flask import Blueprint, render_template, redirect, url_for, flash, current_app
+from sqlalchemy import func
 from app import db
 from app.models import Client
 from .utils import scrape_all_clients
 
 clients_bp = Blueprint('clients', __name__, template_folder='templates')
 
+# Only one scrape at a time; the flag doubles as "sync in progress" state.
+_refresh_lock = threading.Lock()
+_refresh_running = False
+
+
+def _parse_created(date_str: str):
+    """
+    Parse a scraped 'Date Created' string, dispatching on its shape instead
+    of cascading strptime failures: a raised ValueError per row is far more
+    expensive than one substring check, and ~2/3 of rows used to raise.
+    """
+    if len(date_str) == 10 and date_str[4] == '-':
+        fmt = '%Y-%m-%d'
+    elif '/' in date_str:
+        head = date_str.split('/', 1)[0]
+        # Same precedence as before: month-first unless it can't be a month.
+        fmt = '%m/%d/%Y' if head.isdigit() and int(head) <= 12 else '%d/%m/%Y'
+    else:
+        return None
+    try:
+        return datetime.strptime(date_str, fmt)
+    except ValueError:
+        return None
+
 @clients_bp.route('/clients')
 def clients():
     """
     Display all clients from the database, including Name, Date Created,
     Status, Email and Phone.
     """
-    clients_list = Client.query.order_by(Client.created_at).all()
+    # Lightweight tuples — the template only reads these five columns,
+    # so skip ORM object construction and identity-map bookkeeping.
+    clients_list = (
+        Client.query
+              .with_entities(Client.name, Client.created_at,
+                             Client.status, Client.email, Client.phone)
+              .order_by(Client.created_at)
+              .all()
+    )
     return render_template(
         'clients_table.html',
         clients=clients_list,
         active_page='clients'
     )
 
-@clients_bp.route('/refresh_clients', methods=['GET', 'POST'])
-def refresh_clients():
+def _sync_clients() -> int:
     """
     Scrape new client data and upsert directly into the database,
     always honoring the real "Date Created" from the dashboard.
+    Returns the number of newly inserted clients.
     """
-    try:
-        client_dicts = scrape_all_clients()
-    except Exception as e:
-        flash(f"Error scraping clients: {e}", 'error')
-        return redirect(url_for('clients.clients'))
+    client_dicts = scrape_all_clients()
 
-    inserted = 0
+    rows, seen = [], set()
     for row in client_dicts:
         name      = (row.get('Name') or '').strip()
         email     = (row.get('Email') or '').strip()
@@ -42,40 +71,82 @@ def refresh_clients():
         status    = (row.get('Status') or '').strip()
         date_str  = (row.get('Date Created') or '').strip()
 
-        if not name:
+        if not name or (name, email) in seen:
             continue
+        seen.add((name, email))
 
         # Parse the scraped date into a datetime
-        created_at = None
-        if date_str:
-            for fmt in ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y'):
-                try:
-                    created_at = datetime.strptime(date_str, fmt)
-                    break
-                except ValueError:
-                    continue
-
-        # Lookup existing by name+email
-        client = Client.query.filter_by(name=name, email=email).first()
-
-        if not client:
-            # INSERT
-            client = Client(
-                name=name,
-                email=email,
-                phone=phone,
-                status=status,
-                created_at=created_at
-            )
-            db.session.add(client)
-            inserted += 1
+        created_at = _parse_created(date_str) if date_str else None
+
+        rows.append({
+            'name':       name,
+            'email':      email,
+            'phone':      phone,
+            'status':     status,
+            # Core inserts bypass the ORM 'set' listener, so derive the
+            # normalized key here the same way app.models does.
+            'status_key': status.casefold(),
+            'created_at': created_at,
+        })
+
+    inserted = 0
+    if rows:
+        before = db.session.query(func.count(Client.id)).scalar() or 0
+
+        # One round-trip: the uq_clients_name_email index resolves which
+        # rows already exist, replacing the per-row filter_by lookups.
+        if db.engine.dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
         else:
-            # UPDATE existing fields—and ALWAYS overwrite created_at if we parsed it
-            client.phone      = phone
-            client.status     = status
-            if created_at:
-                client.created_at = created_at
-
-    db.session.commit()
-    flash(f"Clients synced! ({inserted} new added)", 'success')
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(Client).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['name', 'email'],
+            set_={
+                'phone':      stmt.excluded.phone,
+                'status':     stmt.excluded.status,
+                'status_key': stmt.excluded.status_key,
+                # ALWAYS overwrite created_at when we parsed one
+                'created_at': func.coalesce(stmt.excluded.created_at,
+                                            Client.created_at),
+            },
+        )
+        db.session.execute(stmt)
+        db.session.commit()
+
+        inserted = (db.session.query(func.count(Client.id)).scalar() or 0) - before
+
+    return inserted
+
+
+@clients_bp.route('/refresh_clients', methods=['GET', 'POST'])
+def refresh_clients():
+    """
+    Kick off the scrape + upsert in a background thread so the Selenium
+    run (minutes on a large client list) doesn't pin a Flask worker.
+    Same fire-and-forget pattern as the franchisor create route.
+    """
+    global _refresh_running
+    app = current_app._get_current_object()
+
+    with _refresh_lock:
+        if _refresh_running:
+            flash("Client sync already in progress.", 'info')
+            return redirect(url_for('clients.clients'))
+        _refresh_running = True
+
+    def _run():
+        global _refresh_running
+        try:
+            with app.app_context():
+                inserted = _sync_clients()
+                app.logger.info(f"[refresh_clients] sync done, {inserted} new clients")
+        except Exception as e:
+            app.logger.error(f"[refresh_clients] background sync failed: {e}")
+        finally:
+            with _refresh_lock:
+                _refresh_running = False
+
+    threading.Thread(target=_run, daemon=True).start()
+    flash("Client sync started — reload in a minute to see new data.", 'success')
     return redirect(url_for('clients.clients'))
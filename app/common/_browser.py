@@ -0,0 +1,185 @@
+# app/common/_browser.py
+"""
+Shared authenticated Playwright session for the Figurella scrapers.
+
+Chromium launch plus the login flow dwarfs any individual scrape, so each
+thread keeps one headless browser with a logged-in page alive between calls
+(sync Playwright objects are bound to their creating thread). The auth
+cookies are persisted via storage_state so even a fresh process usually
+skips the credential form entirely.
+"""
+
+import atexit
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import requests
+from dateutil.relativedelta import relativedelta
+from playwright.sync_api import sync_playwright
+
+LOGIN_URL = "https://newton.hosting.memetic.it/login"
+USERNAME  = "Tutor"
+PASSWORD  = "FiguMass2025$"
+
+# Saved cookie jar — lives next to the other runtime artifacts in instance/.
+AUTH_STATE_PATH = Path(__file__).parents[2] / "instance" / "figurella_auth.json"
+
+_tls = threading.local()
+_all_sessions: list = []
+_all_sessions_lock = threading.Lock()
+
+
+def get_date_range(months_back: int = 6, months_forward: int = 6):
+    """Default report window as MM/DD/YYYY strings: `months_back` months ago
+    through `months_forward` months ahead (0 = today). Every scraper carried
+    its own copy of this."""
+    today = datetime.today()
+    return (
+        (today - relativedelta(months=months_back)).strftime("%m/%d/%Y"),
+        (today + relativedelta(months=months_forward)).strftime("%m/%d/%Y"),
+    )
+
+
+def login(page):
+    """Standard credential flow for the Newton portal — the scrapers all
+    shared byte-identical pasted copies of this before it lived here."""
+    page.goto(LOGIN_URL)
+    page.wait_for_selector("#txtUsername", timeout=10_000)
+    page.fill("#txtUsername", USERNAME)
+    page.fill("#txtPassword", PASSWORD)
+    page.click("#btnAccedi")
+    page.wait_for_selector("text=Reports", timeout=15_000)
+
+
+def get_page(login_fn=None, probe: str = "text=Reports"):
+    """
+    Return a logged-in dashboard page from this thread's shared browser.
+
+    `login_fn(page)` is the caller's login routine (defaults to the shared
+    `login` above), only invoked when the `probe` selector (something
+    visible exclusively after auth) doesn't appear — i.e. on first use or
+    after session expiry.
+    """
+    s = getattr(_tls, "session", None)
+    if s is None or s["page"].is_closed():
+        p = sync_playwright().start()
+        # Flags keep long-lived headless Chromium lean inside containers
+        # (/dev/shm is tiny there, and there's no GPU to probe).
+        browser = p.chromium.launch(
+            headless=True,
+            args=["--disable-dev-shm-usage", "--no-sandbox", "--disable-gpu"],
+        )
+        page = authed_context(browser).new_page()
+        s = _tls.session = {"p": p, "browser": browser, "page": page}
+        with _all_sessions_lock:
+            _all_sessions.append(s)
+
+    return ensure_logged_in(s["page"], login_fn, probe)
+
+
+def close_thread_session():
+    """Close the calling thread's shared session, if it has one.
+
+    Sessions live in threading.local storage, so when their creating thread
+    dies the entry becomes unreachable but its headless Chromium stays alive
+    until process atexit. Threads that won't be reused (short-lived workers,
+    one-off request threads) should call this before finishing instead of
+    leaking a browser per thread.
+    """
+    s = getattr(_tls, "session", None)
+    if s is None:
+        return
+    _tls.session = None
+    with _all_sessions_lock:
+        try:
+            _all_sessions.remove(s)
+        except ValueError:
+            pass
+    try:
+        s["browser"].close()
+        s["p"].stop()
+    except Exception:
+        pass
+
+
+def authed_context(browser):
+    """A new context preloaded with the saved cookie jar, if one exists.
+
+    For scrapers that manage their own sync_playwright() lifecycle: pair
+    with ensure_logged_in() to skip the credential form on warm starts.
+    """
+    return (browser.new_context(storage_state=str(AUTH_STATE_PATH))
+            if AUTH_STATE_PATH.exists() else browser.new_context())
+
+
+def ensure_logged_in(page, login_fn=None, probe: str = "text=Reports"):
+    """
+    Land `page` on the dashboard, running `login_fn` (default: the shared
+    `login` above) only when the `probe` selector — something visible
+    exclusively after auth — doesn't appear. Persists the cookie jar after
+    a fresh login so the next process starts warm.
+    """
+    page.goto(LOGIN_URL, wait_until="domcontentloaded")
+    try:
+        page.wait_for_selector(probe, timeout=2_000)
+    except Exception:
+        (login_fn or login)(page)
+        try:
+            AUTH_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            page.context.storage_state(path=str(AUTH_STATE_PATH))
+        except Exception:
+            pass  # cookies stay valid in-process even if persisting fails
+    return page
+
+
+# One pooled session shared by every scraper: the TCP+TLS handshake to the
+# Newton host is paid once and the keep-alive sockets are reused across all
+# report fetches, instead of a fresh connection per call.
+_http: requests.Session | None = None
+_http_lock = threading.Lock()
+
+
+def _default_utf8(resp, **_):
+    """Pin the encoding when the response omits a charset, so .text decodes
+    directly instead of running byte-level charset detection on every
+    multi-thousand-row export. The Newton exports are UTF-8."""
+    if resp.encoding is None:
+        resp.encoding = "utf-8"
+
+
+def http_session(context) -> requests.Session:
+    """
+    The shared requests.Session, refreshed with the Playwright context's
+    current cookies.
+
+    The report exports are static HTML downloads — fetching them over plain
+    HTTP skips a whole renderer page (goto, JS eval, selector wait), and the
+    persistent connection pool amortizes connect/TLS setup across every
+    report in a run.
+    """
+    global _http
+    with _http_lock:
+        if _http is None:
+            _http = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4,
+                                                    pool_maxsize=4)
+            _http.mount("https://", adapter)
+            _http.mount("http://", adapter)
+            _http.hooks["response"].append(_default_utf8)
+        for c in context.cookies():
+            _http.cookies.set(c["name"], c["value"],
+                              domain=c.get("domain"), path=c.get("path", "/"))
+        return _http
+
+
+@atexit.register
+def _close_sessions():
+    with _all_sessions_lock:
+        sessions, _all_sessions[:] = _all_sessions[:], []
+    for s in sessions:
+        try:
+            s["browser"].close()
+            s["p"].stop()
+        except Exception:
+            pass
@@ -7,7 +7,13 @@ red block (.btn-danger / .text-bg-danger / text contains 'blocked'); else open.
 
 from playwright.sync_api import sync_playwright
 from typing import Dict, List, Optional, Tuple
+import atexit
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import lxml.html as lhtml
 
 from app.common.create_appointment import login as _login
 from app.common.create_appointment import goto_calendar_and_set_date as _goto_date
@@ -33,9 +39,10 @@ def _extract_panel_html_from_delta(payload: str, panel_id: str) -> Optional[str]
 # ---------- HTML parsing ----------
 
 _TIME_RX = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*([ap])m\s*$", re.I)
+_WS_RX   = re.compile(r"\s+")
 
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return _WS_RX.sub(" ", (s or "")).strip()
 
 def _format_time12(s: str) -> str:
     s = _norm((s or "").lower().replace(".", ""))
@@ -45,119 +52,198 @@ def _format_time12(s: str) -> str:
     hh = str(int(m.group(1)))
     return f"{hh}:{m.group(2)} {m.group(3)}"
 
+def _cell_is_busy(td) -> bool:
+    """Busy = green pill, red block, or literal 'blocked' in the cell text."""
+    for el in td.iter():
+        cls = el.get("class") or ""
+        if ("btn-danger" in cls or "text-bg-danger" in cls
+                or ("badge" in cls and "text-bg-success" in cls)):
+            return True
+    return "blocked" in td.text_content().lower()
+
 def _parse_table_from_html(html: str) -> Tuple[List[str], List[Tuple[str, List[bool]]]]:
     """Parse agenda table HTML → (headers, rows)."""
     headers: List[str] = []
-    thead_match = re.search(r"<thead[^>]*>(.*?)</thead>", html, flags=re.S | re.I)
-    if thead_match:
-        ths = re.findall(r"<th[^>]*>(.*?)</th>", thead_match.group(1), flags=re.S | re.I)
-        for th in ths:
-            text = _norm(re.sub(r"<[^>]+>", " ", th))
-            if text and not re.fullmatch(r"(?i)time", text):
+    rows: List[Tuple[str, List[bool]]] = []
+    tree = lhtml.fromstring(html) if html and html.strip() else None
+
+    # One C-level parse instead of layered regex passes over the same bytes:
+    # thead/tbody/tr/td extraction and class checks become tree lookups.
+    if tree is not None:
+        for th in tree.xpath("//thead//th"):
+            text = _norm(th.text_content())
+            if text and text.lower() != "time":
                 headers.append(text)
     if not headers:
         headers = ["Consultation","Bubble 1","Bubble 2","Bubble 3","Bubble 4","Cellushape"]
-
-    rows: List[Tuple[str, List[bool]]] = []
-    tbody_match = re.search(r"<tbody[^>]*>(.*?)</tbody>", html, flags=re.S | re.I)
-    if not tbody_match:
+    if tree is None:
         return headers, rows
 
-    for tr_html in re.findall(r"<tr[^>]*>(.*?)</tr>", tbody_match.group(1), flags=re.S | re.I):
+    for tr in tree.xpath("//tbody/tr"):
+        tds = tr.xpath("./td")
+
         # find time cell
         time_label, time_idx = "", -1
-        for idx, cell_html in enumerate(re.findall(r"<td[^>]*>(.*?)</td>", tr_html, flags=re.S | re.I)):
-            text = _norm(re.sub(r"<[^>]+>", " ", cell_html))
-            if time_idx < 0 and _TIME_RX.match(text or ""):
+        for idx, td in enumerate(tds):
+            text = _norm(td.text_content())
+            if _TIME_RX.match(text):
                 time_idx, time_label = idx, text
                 break
         if time_idx < 0:
             continue
 
         # device cells
-        rdev_cells = re.findall(r"<td[^>]*class=['\"][^'\"]*r_device[^'\"]*['\"][^>]*>(.*?)</td>",
-                                tr_html, flags=re.S | re.I)
-        dev_cells = rdev_cells if rdev_cells else re.findall(
-            r"<td[^>]*>(.*?)</td>", tr_html, flags=re.S | re.I)[time_idx + 1 :
-        ]
-
-        # busy detection
-        busy_flags: List[bool] = []
-        for i in range(len(headers)):
-            cell = dev_cells[i] if i < len(dev_cells) else ""
-            green = re.search(r"class=['\"][^'\"]*badge[^'\"]*text-bg-success[^'\"]*['\"]", cell, re.I)
-            red   = re.search(r"class=['\"][^'\"]*(btn-danger|text-bg-danger)[^'\"]*['\"]", cell, re.I)
-            blocked = re.search(r"blocked", cell, re.I)
-            busy_flags.append(bool(green or red or blocked))
+        rdev_cells = [td for td in tds if "r_device" in (td.get("class") or "")]
+        dev_cells = rdev_cells if rdev_cells else tds[time_idx + 1:]
 
+        busy_flags = [
+            i < len(dev_cells) and _cell_is_busy(dev_cells[i])
+            for i in range(len(headers))
+        ]
         rows.append((_format_time12(time_label), busy_flags))
 
     return headers, rows
 
+# ---------- Shared browser session ----------
+# Chromium cold start + login dominates get_open_slots latency, so keep a
+# logged-in page alive between calls. Playwright's sync API objects are bound
+# to the thread that created them — and the WSGI server hands each request
+# its own short-lived thread — so all browser work is funneled through one
+# dedicated long-lived worker thread that owns the single session, instead of
+# launching (and never closing) a Chromium per request thread.
+
+_tls = threading.local()
+_all_sessions: list = []
+_all_sessions_lock = threading.Lock()
+
+_worker: ThreadPoolExecutor | None = None
+_worker_lock = threading.Lock()
+
+
+def _get_worker() -> ThreadPoolExecutor:
+    """The single-thread executor every availability check runs on."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = ThreadPoolExecutor(max_workers=1,
+                                         thread_name_prefix="availability")
+        return _worker
+
+
+def _session_page():
+    """Return a logged-in agenda page, starting browser + login lazily."""
+    s = getattr(_tls, "session", None)
+    if s is None or s["page"].is_closed():
+        p = sync_playwright().start()
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_context().new_page()
+        _login(page)
+        s = _tls.session = {"p": p, "browser": browser, "page": page}
+        with _all_sessions_lock:
+            _all_sessions.append(s)
+    elif "login" in (s["page"].url or "").lower():
+        # ASP.NET session expired and bounced us back to the login form.
+        _login(s["page"])
+    return s["page"]
+
+
+@atexit.register
+def _close_sessions():
+    with _all_sessions_lock:
+        sessions, _all_sessions[:] = _all_sessions[:], []
+    for s in sessions:
+        try:
+            s["browser"].close()
+            s["p"].stop()
+        except Exception:
+            pass
+
+# ---------- Result cache ----------
+# Availability for a date rarely changes second-to-second; a short TTL lets
+# back-to-back queries for the same date skip the whole browser round-trip.
+
+_SLOT_TTL = 45.0  # seconds
+_SLOT_CACHE: Dict[tuple, Tuple[float, Dict[str, List[str]]]] = {}
+
+
+def invalidate_slots(date_iso: Optional[str] = None) -> None:
+    """Drop cached availability — for one date, or all if date_iso is None.
+
+    Called after an appointment is created so the next check reflects it.
+    """
+    if date_iso is None:
+        _SLOT_CACHE.clear()
+    else:
+        for key in [k for k in _SLOT_CACHE if k[0] == date_iso]:
+            _SLOT_CACHE.pop(key, None)
+
 # ---------- Public API ----------
 
 def get_open_slots(date_iso: str,
                    allowed_columns: Optional[List[str]] = None) -> Dict[str, List[str]]:
     """
-    1) Login & navigate to agenda
+    1) Reuse (or lazily create) a logged-in agenda page
     2) Set the date (triggers async postback)
     3) Intercept the async postback RESPONSE
     4) Parse UpdatePanel HTML → compute availability
-    """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)   # headless=False for debugging
-        ctx = browser.new_context()
-        page = ctx.new_page()
-
-        _login(page)
 
-        delta_payload = {"text": None}
-        def _on_response(resp):
-            try:
-                ct = resp.headers.get("content-type", "") if hasattr(resp, "headers") else ""
-                xma = resp.headers.get("x-microsoftajax", "") if hasattr(resp, "headers") else ""
-                if "text/plain" in ct and "Delta" in xma:
-                    txt = resp.text()
-                    if PANEL_ID in txt:
-                        delta_payload["text"] = txt
-            except Exception:
-                pass
-        ctx.on("response", _on_response)
-
-        _goto_date(page, date_iso)
-
-        page.wait_for_timeout(200)
-        if not delta_payload["text"]:
-            for _ in range(20):
-                page.wait_for_timeout(150)
-                if delta_payload["text"]:
-                    break
-
-        if not delta_payload["text"]:
-            panel_html = page.locator(f"#{PANEL_ID}").inner_html()
-        else:
-            panel_html = _extract_panel_html_from_delta(delta_payload["text"], PANEL_ID) or ""
-
-        headers, parsed_rows = _parse_table_from_html(panel_html)
-
-        if allowed_columns:
-            wanted = { _norm(c).lower() for c in allowed_columns }
-            headers = [h for h in headers if _norm(h).lower() in wanted]
-
-        results: Dict[str, List[str]] = { h: [] for h in headers }
-        for time_label, busy_flags in parsed_rows:
-            for i, h in enumerate(headers):
-                if i < len(busy_flags) and not busy_flags[i]:
-                    results[h].append(time_label)
-
-        # dedupe
-        for h, arr in list(results.items()):
-            seen, out = set(), []
-            for t in arr:
-                key = _norm(t).lower()
-                if key not in seen:
-                    out.append(t); seen.add(key)
-            results[h] = out
-
-        ctx.close(); browser.close()
-        return results
+    The cache is answered on the calling thread; misses run on the
+    dedicated browser worker thread, which owns the one Playwright session.
+    """
+    cache_key = (date_iso, tuple(sorted(allowed_columns or ())))
+    hit = _SLOT_CACHE.get(cache_key)
+    if hit is not None and time.monotonic() - hit[0] < _SLOT_TTL:
+        return hit[1]
+
+    results = _get_worker().submit(_fetch_slots, date_iso, allowed_columns).result()
+    _SLOT_CACHE[cache_key] = (time.monotonic(), results)
+    return results
+
+
+def _fetch_slots(date_iso: str,
+                 allowed_columns: Optional[List[str]]) -> Dict[str, List[str]]:
+    """Drive the browser for one availability check — worker thread only."""
+    page = _session_page()
+
+    def _is_delta(resp) -> bool:
+        ct = resp.headers.get("content-type", "")
+        xma = resp.headers.get("x-microsoftajax", "")
+        return "text/plain" in ct and "Delta" in xma
+
+    # expect_response resolves the moment the async postback lands — no fixed
+    # pre-wait and no 150 ms polling loop.
+    delta_text = None
+    try:
+        with page.expect_response(_is_delta, timeout=5000) as resp_info:
+            _goto_date(page, date_iso)
+        txt = resp_info.value.text()
+        if PANEL_ID in txt:
+            delta_text = txt
+    except Exception:
+        pass
+
+    if delta_text is None:
+        panel_html = page.locator(f"#{PANEL_ID}").inner_html()
+    else:
+        panel_html = _extract_panel_html_from_delta(delta_text, PANEL_ID) or ""
+
+    headers, parsed_rows = _parse_table_from_html(panel_html)
+
+    if allowed_columns:
+        wanted = { _norm(c).lower() for c in allowed_columns }
+        headers = [h for h in headers if _norm(h).lower() in wanted]
+
+    results: Dict[str, List[str]] = { h: [] for h in headers }
+    for time_label, busy_flags in parsed_rows:
+        for i, h in enumerate(headers):
+            if i < len(busy_flags) and not busy_flags[i]:
+                results[h].append(time_label)
+
+    # dedupe — dict keeps insertion order, setdefault keeps the first casing
+    for h, arr in results.items():
+        uniq: Dict[str, str] = {}
+        for t in arr:
+            uniq.setdefault(_norm(t).lower(), t)
+        results[h] = list(uniq.values())
+
+    return results
@@ -1,8 +1,13 @@
 # app/common/create_appointment.py
-from playwright.sync_api import sync_playwright
-import re, time, unicodedata
+from playwright.sync_api import sync_playwright, Error as PWError, TimeoutError as PWTimeout
+from functools import lru_cache
+import os, re, time, unicodedata
 from typing import Optional
 
+# FIG_DEBUG_BROWSER=1 re-enables the headful/slow-mo browser and the
+# per-event console/response logging for local debugging.
+_DEBUG_BROWSER = os.getenv("FIG_DEBUG_BROWSER", "0") == "1"
+
 LOGIN_URL   = "https://newton.hosting.memetic.it/login"
 AGENDA_URL  = "https://newton.hosting.memetic.it/assist/agenda_edit"
 CAL_WRAP_ID = "ctl00_cphMain_upnlMain"
@@ -15,22 +20,46 @@ BAD_CODES = set(range(400, 600))
 
 # ───────── helpers ─────────
 
+_RE_WS         = re.compile(r"\s+")
+_RE_AMPM_TIGHT = re.compile(r"(\d)(am|pm)$")
+_RE_TIME_4DIG  = re.compile(r"^(\d{1,2})(\d{2})\s*(am|pm)$")
+_RE_TIME_LOOSE = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)?$")
+_RE_TIME_NORM  = re.compile(r"^(\d{1,2}):(\d{2})\s*([ap])m$")
+_RE_ISO_DATE   = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+# Translation table for the accents that actually occur in client names —
+# str.translate is a single C pass vs per-call NFKD + combining-mark filter.
+_ACCENT_TABLE = {
+    ord(c): unicodedata.normalize("NFKD", c)[0]
+    for c in ("àáâãäåèéêëìíîïòóôõöùúûüñçýÿ"
+              "ÀÁÂÃÄÅÈÉÊËÌÍÎÏÒÓÔÕÖÙÚÛÜÑÇÝ")
+}
+
+# These are pure string normalizers hit once per suggestion / per grid row
+# with a handful of distinct inputs — memoizing them turns the repeat calls
+# into dict lookups.
+
+@lru_cache(maxsize=4096)
 def _slug(s: str) -> str:
     """Lowercase, strip, collapse spaces, remove accents for robust name compare."""
     if not s: return ""
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    s = re.sub(r"\s+", " ", s).strip().lower()
+    s = s.translate(_ACCENT_TABLE)
+    if not s.isascii():
+        # Something outside the common accent set — full unicode fallback.
+        s = unicodedata.normalize("NFKD", s)
+        s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = _RE_WS.sub(" ", s).strip().lower()
     return s
 
+@lru_cache(maxsize=4096)
 def _normalize_time_label(raw: str) -> str:
     if not raw: return ""
     s = str(raw).strip().lower().replace(".", "")
-    s = re.sub(r"\s+", " ", s)
-    s = re.sub(r"(\d)(am|pm)$", r"\1 \2", s)
-    m = re.match(r"^(\d{1,2})(\d{2})\s*(am|pm)$", s)
+    s = _RE_WS.sub(" ", s)
+    s = _RE_AMPM_TIGHT.sub(r"\1 \2", s)
+    m = _RE_TIME_4DIG.match(s)
     if m: return f"{int(m.group(1))}:{m.group(2)} {m.group(3)}"
-    m = re.match(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)?$", s)
+    m = _RE_TIME_LOOSE.match(s)
     if m:
         hh = int(m.group(1)); mm = m.group(2) or "00"; ap = m.group(3)
         if ap in ("am","pm"): return f"{hh}:{mm} {ap}"
@@ -40,40 +69,43 @@ def _normalize_time_label(raw: str) -> str:
         if 13 <= hh <= 23: return f"{hh-12}:{mm} pm"
     return s
 
+@lru_cache(maxsize=4096)
 def _time_to_minutes(label: str):
     if not label: return None
     txt = _normalize_time_label(label).lower()
-    m = re.match(r"^(\d{1,2}):(\d{2})\s*([ap])m$", txt)
+    m = _RE_TIME_NORM.match(txt)
     if not m: return None
     hh, mm, ap = int(m.group(1)), int(m.group(2)), m.group(3)
     if hh == 12: hh = 0 if ap == "a" else 12
     elif ap == "p": hh += 12
     return hh*60 + mm
 
+# Grid geometry: first slot at 05:30 am, resources in fixed column order.
+_GRID_START_MIN = 5*60 + 30
+_RESOURCE_MAP = {
+    "consultation": 0,
+    "bubble 1": 1,
+    "bubble 2": 2,
+    "bubble 3": 3,
+    "bubble 4": 4,
+    "cellushape": 5,
+}
+
 def _slot_index(time_label: str) -> int:
     mins = _time_to_minutes(time_label)
     if mins is None: raise RuntimeError(f"Unrecognized time '{time_label}'.")
-    start = 5*60 + 30
-    delta = mins - start
+    delta = mins - _GRID_START_MIN
     if delta < 0 or (delta % 30) != 0:
         raise RuntimeError(f"Time '{time_label}' must be on a 30-minute grid ≥ 05:30 am.")
     return delta // 30
 
 def _resource_index(column_label: str) -> int:
     lab = column_label.strip().lower()
-    mapping = {
-        "consultation": 0,
-        "bubble 1": 1,
-        "bubble 2": 2,
-        "bubble 3": 3,
-        "bubble 4": 4,
-        "cellushape": 5,
-    }
-    if lab not in mapping: raise RuntimeError(f"Unknown column label: {column_label}")
-    return mapping[lab]
+    if lab not in _RESOURCE_MAP: raise RuntimeError(f"Unknown column label: {column_label}")
+    return _RESOURCE_MAP[lab]
 
 def _to_mmddyyyy(date_str: str) -> str:
-    m = re.match(r"^(\d{4})-(\d{2})-(\d{2})$", date_str or "")
+    m = _RE_ISO_DATE.match(date_str or "")
     if m: y, mo, d = m.groups(); return f"{mo}/{d}/{y}"
     return date_str
 
@@ -88,6 +120,23 @@ def _webforms_submit(page, target: str, argument: str = ""):
         {"target": target, "argument": argument}
     )
 
+def _set_date_and_submit(page, portal_date: str):
+    """Set both date fields and fire the WebForms postback in one evaluate
+    (one IPC round-trip instead of a set-values call plus _webforms_submit)."""
+    page.evaluate(
+        """(val)=> {
+          const t=document.getElementById('ctl00_cphMain_SelectDataPrincipale_txtDataSel');
+          const h=document.getElementById('ctl00_cphMain_SelectDataPrincipale_hidDataSel');
+          if(t) t.value=val; if(h) h.value=val;
+          const form=document.getElementById('aspnetForm'); if(!form) return;
+          const et=document.getElementById('__EVENTTARGET');
+          if(et) et.value='ctl00$cphMain$SelectDataPrincipale$hidDataSel';
+          const ea=document.getElementById('__EVENTARGUMENT'); if(ea) ea.value='';
+          form.submit && form.submit();
+        }""",
+        portal_date
+    )
+
 def _wait_webforms_async_complete(page, timeout_ms: int = 15000):
     try:
         page.wait_for_function(
@@ -105,16 +154,20 @@ def _wait_webforms_async_complete(page, timeout_ms: int = 15000):
 
 def _cell_locator_for(page, time_label: str, column_label: str):
     want = _time_to_minutes(time_label)
-    rows = page.locator(f"#{CAL_WRAP_ID} table tbody tr")
-    n = rows.count()
-    row_loc = None
-    for i in range(n):
-        raw = (rows.nth(i).locator("td").first.inner_text(timeout=0) or "").strip()
-        if _time_to_minutes(raw) == want:
-            row_loc = rows.nth(i); break
-    if row_loc is None: raise RuntimeError(f"Time row not found: {time_label}")
+    # One evaluate pulls every row's time-cell text in a single IPC round
+    # trip; the old nth()/inner_text() loop paid one round trip per row.
+    texts = page.evaluate(
+        "() => Array.from(document.querySelectorAll("
+        f"'#{CAL_WRAP_ID} table tbody tr'"
+        ")).map(tr => tr.cells.length ? tr.cells[0].innerText : '')"
+    )
+    row_idx = -1
+    for i, raw in enumerate(texts):
+        if _time_to_minutes((raw or "").strip()) == want:
+            row_idx = i; break
+    if row_idx < 0: raise RuntimeError(f"Time row not found: {time_label}")
     td_idx = 1 + _resource_index(column_label)
-    return row_loc.locator("td").nth(td_idx)
+    return page.locator(f"#{CAL_WRAP_ID} table tbody tr").nth(row_idx).locator("td").nth(td_idx)
 
 # ───────── client binding (full name only) ─────────
 
@@ -134,8 +187,8 @@ def _pick_select2_by_name(page, full_name: str) -> bool:
         )
         if wrappers.count():
             try: wrappers.first.click()
-            except: pass
-    except:
+            except (PWTimeout, PWError): pass
+    except (PWTimeout, PWError):
         pass
 
     # Nudge the widget to fetch suggestions
@@ -150,7 +203,7 @@ def _pick_select2_by_name(page, full_name: str) -> bool:
                 ['input','keyup','keydown','change'].forEach(t => el.dispatchEvent(new Event(t, {bubbles:true})));
               }
             """, "ctl00_cphMain_SelectClienteAddAppuntamento_txtSelectCliente")
-    except:
+    except (PWTimeout, PWError):
         pass
 
     # Candidate result containers
@@ -164,47 +217,59 @@ def _pick_select2_by_name(page, full_name: str) -> bool:
     results = page.locator(results_query)
     try:
         results.first.wait_for(timeout=5000)
-    except:
+    except (PWTimeout, PWError):
         # one more nudge
         try:
             txt = page.locator("#ctl00_cphMain_SelectClienteAddAppuntamento_txtSelectCliente")
             if txt.count():
                 txt.type(" ", delay=10)
                 txt.press("Backspace")
-        except:
+        except (PWTimeout, PWError):
             pass
         try:
             results.first.wait_for(timeout=4000)
-        except:
+        except (PWTimeout, PWError):
             return False
 
-    # Build list for matching
-    items = []
+    # Common case for a full-name typeahead: the backend returns exactly one
+    # suggestion — click it without the extraction/matching passes.
     cnt = results.count()
-    for i in range(cnt):
+    if cnt == 0:
+        return False
+    if cnt == 1:
+        try:
+            results.first.click(); return True
+        except (PWTimeout, PWError):
+            return False
+
+    # Resolve every suggestion once: element_handles() is a single query and
+    # each handle keeps its remote object id, so inner_text/click reuse it
+    # instead of re-resolving results.nth(i) over the CDP bridge each time.
+    items = []
+    for handle in results.element_handles():
         try:
-            t = (results.nth(i).inner_text(timeout=0) or "").strip()
-        except:
+            t = (handle.inner_text() or "").strip()
+        except (PWTimeout, PWError):
             t = ""
         if not t: continue
-        items.append((i, t, _slug(t)))
+        items.append((handle, t, _slug(t)))
 
     # exact / startswith / contains
-    for i, raw, slug in items:
+    for handle, raw, slug in items:
         if slug == want:
             try:
-                results.nth(i).click(); return True
-            except: pass
-    for i, raw, slug in items:
+                handle.click(); return True
+            except (PWTimeout, PWError): pass
+    for handle, raw, slug in items:
         if slug.startswith(want) or want in slug:
             try:
-                results.nth(i).click(); return True
-            except: pass
+                handle.click(); return True
+            except (PWTimeout, PWError): pass
 
     # fallback: first suggestion
     try:
         results.first.click(); return True
-    except:
+    except (PWTimeout, PWError):
         return False
 
 def _bind_customer(page, name: str) -> str:
@@ -218,9 +283,9 @@ def _bind_customer(page, name: str) -> str:
     txt.click(force=True)
     try:
         txt.press("Control+A")
-    except:
+    except (PWTimeout, PWError):
         try: txt.press("Meta+A")
-        except: pass
+        except (PWTimeout, PWError): pass
     txt.press("Backspace")
     txt.type(name, delay=25)
 
@@ -230,7 +295,7 @@ def _bind_customer(page, name: str) -> str:
         try:
             txt.press("ArrowDown")
             txt.press("Enter")
-        except:
+        except (PWTimeout, PWError):
             pass
 
     # Verify the widget set the hidden id (server needs a real numeric id here)
@@ -238,7 +303,7 @@ def _bind_customer(page, name: str) -> str:
         hid_val = page.evaluate(
             "() => document.getElementById('ctl00_cphMain_SelectClienteAddAppuntamento_hidSelectedCliente')?.value || ''"
         )
-    except:
+    except (PWTimeout, PWError):
         hid_val = ""
 
     print(f"DEBUG: hidSelectedCliente after selection = '{hid_val}'")
@@ -249,27 +314,26 @@ def _bind_customer(page, name: str) -> str:
 
 # ───────── core flow ─────────
 
+def _is_postback_response(resp) -> bool:
+    """A real ASP.NET postback reply, not resource/asset traffic."""
+    return (resp.request.method == "POST"
+            and resp.status < 400
+            and "ScriptResource.axd" not in resp.url)
+
 def login(page):
     page.goto(LOGIN_URL, wait_until="domcontentloaded")
     page.fill('input[type="text"]', FIG_USER)
     page.fill('input[type="password"]', FIG_PASS)
     page.click('input[type="submit"], button:has-text("Login"), button:has-text("Accedi")')
-    page.wait_for_load_state("networkidle")
+    # networkidle stalled on the portal's background chatter; wait for the
+    # nav element that only exists once authenticated.
+    page.wait_for_selector("text=Reports", timeout=15000)
 
 def goto_calendar_and_set_date(page, date_iso: str):
     page.goto(AGENDA_URL, wait_until="domcontentloaded")
     page.locator(f"#{CAL_WRAP_ID}").wait_for(timeout=15000)
-    portal_date = _to_mmddyyyy(date_iso)
-    page.evaluate(
-        """(val)=> {
-          const t=document.getElementById('ctl00_cphMain_SelectDataPrincipale_txtDataSel');
-          const h=document.getElementById('ctl00_cphMain_SelectDataPrincipale_hidDataSel');
-          if(t) t.value=val; if(h) h.value=val;
-        }""",
-        portal_date
-    )
-    _webforms_submit(page, "ctl00$cphMain$SelectDataPrincipale$hidDataSel", "")
-    page.wait_for_load_state("networkidle")
+    with page.expect_response(_is_postback_response, timeout=15000):
+        _set_date_and_submit(page, _to_mmddyyyy(date_iso))
     page.locator(f"#{CAL_WRAP_ID} table tbody tr").first.wait_for(timeout=15000)
 
 def open_modal_by_time_and_column(page, time_label: str, column_label: str):
@@ -337,25 +401,22 @@ def fill_modal_and_confirm(page, customer_name: str, memo: str = "",
     if _grid_has_chip():
         return True
 
-    # 4) Retry once (helps with async/race)
+    # 4) Re-check before re-submitting: a slow postback can land the chip
+    #    after the first wait, and re-clicking then would double-book.
+    _wait_roundtrip()
+    if _grid_has_chip():
+        return True
+
+    # 5) Retry once only after the verified miss
     _click_confirm_native(page)
     _wait_roundtrip()
     if _grid_has_chip():
         return True
 
-    # 5) Final attempt: soft refresh same date (if provided) and re-check
+    # 6) Final attempt: soft refresh same date (if provided) and re-check
     if date_iso:
         try:
-            portal_date = _to_mmddyyyy(date_iso)
-            page.evaluate(
-                """(val)=> {
-                  const txt=document.getElementById('ctl00_cphMain_SelectDataPrincipale_txtDataSel');
-                  const hid=document.getElementById('ctl00_cphMain_SelectDataPrincipale_hidDataSel');
-                  if(txt) txt.value=val; if(hid) hid.value=val;
-                }""",
-                portal_date
-            )
-            _webforms_submit(page, "ctl00$cphMain$SelectDataPrincipale$hidDataSel", "")
+            _set_date_and_submit(page, _to_mmddyyyy(date_iso))
             _wait_roundtrip()
             page.locator(f"#{CAL_WRAP_ID} table tbody tr").first.wait_for(timeout=15000)
         except Exception:
@@ -370,14 +431,20 @@ def fill_modal_and_confirm(page, customer_name: str, memo: str = "",
 # ───────── public API ─────────
 
 def create_appointment(date_iso: str, column_label: str, time_label: str,
-                       customer_name: str, memo: str = "") -> bool:
+                       customer_name: str, memo: str = "",
+                       headless: bool = True, slow_mo: int = 0) -> bool:
+    if _DEBUG_BROWSER:
+        headless, slow_mo = False, 50
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=50)
+        # slow_mo taxes every action; ~30 actions per booking made the old
+        # slow_mo=50 ≈1.5s of pure sleep, plus headful compositor cost.
+        browser = p.chromium.launch(headless=headless, slow_mo=slow_mo)
         context = browser.new_context()
         page = context.new_page()
-        page.on("console", lambda msg: print("PAGE LOG:", msg.type, msg.text))
-        page.on("pageerror", lambda err: print("PAGE ERROR:", err))
-        page.on("response", lambda r: (print("[HTTP]", r.status, r.url[-140:])) if r.status in BAD_CODES else None)
+        if _DEBUG_BROWSER:
+            page.on("console", lambda msg: print("PAGE LOG:", msg.type, msg.text))
+            page.on("pageerror", lambda err: print("PAGE ERROR:", err))
+            page.on("response", lambda r: (print("[HTTP]", r.status, r.url[-140:])) if r.status in BAD_CODES else None)
 
         try:
             login(page)
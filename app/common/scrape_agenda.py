@@ -2,81 +2,146 @@
 
 import sys
 import os
+import threading
+import time
 import pandas as pd
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from playwright.sync_api import sync_playwright
-
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from app.common import _browser
+from app.common._browser import get_date_range
 from app.common.cleaners import drop_unwanted_rows
 from app.common.utils    import persist_report
 
-LOGIN_URL = "https://newton.hosting.memetic.it/login"
-
-
-def get_date_range(months_back: int = 6, months_forward: int = 6):
-    today = datetime.today()
-    return (
-        (today - relativedelta(months=months_back)).strftime("%m/%d/%Y"),
-        (today + relativedelta(months=months_forward)).strftime("%m/%d/%Y")
-    )
-
-
-def login(page):
-    page.goto(LOGIN_URL)
-    page.wait_for_load_state("networkidle")
-    page.wait_for_selector("#txtUsername", timeout=10_000)
-    page.fill("#txtUsername", "Tutor")
-    page.fill("#txtPassword", "FiguMass2025$")
-    page.click("#btnAccedi")
-    page.wait_for_selector("text=Reports", timeout=15_000)
-
-
-def scrape_agenda(from_date: str, to_date: str) -> pd.DataFrame:
-    data = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        ctx     = browser.new_context()
-        page    = ctx.new_page()
-
-        login(page)
-        page.click("text=Reports");  page.wait_for_timeout(500)
-        page.click("text=Agenda");   page.wait_for_timeout(500)
-
-        page.fill("#ctl00_cphMain_SelectDataDal_txtDataSel", from_date)
-        page.fill("#ctl00_cphMain_SelectDataAl_txtDataSel", to_date)
-        page.click("text=Do Report")
-
-        page.wait_for_selector("#ctl00_cphMain_hlyDownloadHTML", timeout=15_000)
-        href = page.get_attribute("#ctl00_cphMain_hlyDownloadHTML", "href")
-        if not href:
-            print("❌ Could not extract report link.")
-            browser.close()
+# Windows longer than this get split and scraped on parallel sessions.
+_SPLIT_THRESHOLD_DAYS = 120
+_MAX_WORKERS = 2
+
+# Persistent pool: the same worker threads (and their logged-in _browser
+# sessions) serve every scrape — a throwaway pool per call would orphan a
+# Chromium per worker at shutdown and relaunch them next time.
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=_MAX_WORKERS,
+                                       thread_name_prefix="scrape_agenda")
+        return _pool
+
+# Finished results memoized per (from_date, to_date): repeat pulls of the
+# same window within the TTL skip the whole Playwright flow.
+_RESULT_TTL = 600.0  # seconds
+_RESULT_CACHE: dict[tuple[str, str], tuple[float, pd.DataFrame]] = {}
+
+
+def _split_range(from_date: str, to_date: str, parts: int):
+    """Split [from_date, to_date] into `parts` contiguous, non-overlapping
+    sub-windows (mm/dd/yyyy strings)."""
+    start = datetime.strptime(from_date, "%m/%d/%Y")
+    end   = datetime.strptime(to_date, "%m/%d/%Y")
+    span  = (end - start).days
+    step  = span // parts
+    windows = []
+    lo = start
+    for i in range(parts):
+        hi = end if i == parts - 1 else lo + timedelta(days=step)
+        windows.append((lo.strftime("%m/%d/%Y"), hi.strftime("%m/%d/%Y")))
+        lo = hi + timedelta(days=1)
+    return windows
+
+
+def scrape_agenda(from_date: str, to_date: str, force: bool = False) -> pd.DataFrame:
+    """
+    Scrape the Agenda report for the window, splitting wide ranges across a
+    small thread pool. Sync Playwright objects are thread-bound, so each
+    worker drives its own per-thread _browser session rather than sharing
+    pages — parallelism comes from concurrent sessions, not coroutines.
+
+    Results are memoized per window for _RESULT_TTL seconds; pass
+    force=True to bypass the cache and re-scrape.
+    """
+    key = (from_date, to_date)
+    if not force:
+        hit = _RESULT_CACHE.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _RESULT_TTL:
+            return hit[1].copy()
+
+    try:
+        span_days = (datetime.strptime(to_date, "%m/%d/%Y")
+                     - datetime.strptime(from_date, "%m/%d/%Y")).days
+    except ValueError:
+        span_days = 0
+
+    if span_days > _SPLIT_THRESHOLD_DAYS:
+        windows = _split_range(from_date, to_date, _MAX_WORKERS)
+        frames = list(_get_pool().map(lambda w: _scrape_window(*w), windows))
+        frames = [f for f in frames if not f.empty]
+        if not frames:
             return pd.DataFrame()
-
-        report_url  = f"https://newton.hosting.memetic.it/assist/{href}"
-        report_page = ctx.new_page()
+        df = pd.concat(frames, ignore_index=True)
+    else:
+        df = _scrape_window(from_date, to_date)
+        if df.empty:
+            return df
+
+    df = drop_unwanted_rows(df)
+    # Explicit dtypes: the status columns repeat a handful of values, so
+    # category cuts memory for long ranges; Phone stays string (never numeric).
+    df["Phone"] = df["Phone"].astype("string")
+    for col in ("Customer Status", "Appointment Status"):
+        df[col] = df[col].astype("category")
+    _RESULT_CACHE[key] = (time.monotonic(), df)
+    return df.copy()
+
+
+def _scrape_window(from_date: str, to_date: str) -> pd.DataFrame:
+    # Shared logged-in session: no Chromium cold start or login round-trip
+    # after the first call in a thread.
+    page = _browser.get_page()
+
+    # Wait for what each click reveals instead of padding with timeouts.
+    page.click("text=Reports")
+    page.wait_for_selector("text=Agenda", state="visible", timeout=5_000)
+    page.click("text=Agenda")
+    page.wait_for_selector("#ctl00_cphMain_SelectDataDal_txtDataSel", timeout=10_000)
+
+    page.fill("#ctl00_cphMain_SelectDataDal_txtDataSel", from_date)
+    page.fill("#ctl00_cphMain_SelectDataAl_txtDataSel", to_date)
+    page.click("text=Do Report")
+
+    page.wait_for_selector("#ctl00_cphMain_hlyDownloadHTML", timeout=15_000)
+    href = page.get_attribute("#ctl00_cphMain_hlyDownloadHTML", "href")
+    if not href:
+        print("❌ Could not extract report link.")
+        return pd.DataFrame()
+
+    report_url  = f"https://newton.hosting.memetic.it/assist/{href}"
+    report_page = page.context.new_page()
+    try:
         report_page.goto(report_url)
         report_page.wait_for_selector("table", timeout=10_000)
 
-        rows    = report_page.locator("table tr")
         headers = [
             "First Name", "Last Name", "Email", "Phone",
             "Customer Status", "Day", "Appointment Status"
         ]
 
-        for i in range(1, rows.count()):
-            cols = rows.nth(i).locator("td").all()
-            row  = [col.inner_text().strip() for col in cols]
-            if len(row) == len(headers):
-                data.append(row)
-
-        browser.close()
-
-    df = pd.DataFrame(data, columns=headers) if data else pd.DataFrame()
-    if df.empty:
-        return df
-
-    return drop_unwanted_rows(df)
+        # One evaluate returns the whole table; the per-row nth()/inner_text()
+        # loop paid a CDP round-trip per cell, thousands for a 6-month range.
+        raw_rows = report_page.evaluate(
+            """() => Array.from(document.querySelectorAll('table tr'))
+                     .slice(1)
+                     .map(tr => Array.from(tr.cells)
+                                     .map(td => td.innerText.trim()))"""
+        )
+        data = [tuple(row) for row in raw_rows if len(row) == len(headers)]
+    finally:
+        report_page.close()
+
+    return pd.DataFrame.from_records(data, columns=headers) if data else pd.DataFrame()
 
 
 def main():
@@ -0,0 +1,67 @@
+# app/common/scrape_all.py
+"""
+Run several report scrapers concurrently instead of back-to-back.
+
+The scrapers are network-wait-bound, so running them sequentially costs the
+sum of their portal round-trips; a small thread pool brings the wall clock
+down to roughly the slowest one. Sync Playwright objects are bound to their
+creating thread, so each worker drives its own browser session — the pool
+is a persistent module-level singleton, so the same worker threads (and
+their logged-in _browser sessions) are reused by every refresh instead of
+being orphaned at pool shutdown with their Chromium still running.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_MAX_WORKERS = 3
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ThreadPoolExecutor:
+    """The shared executor, created on first use (`max_workers` is only
+    honored then — later calls reuse the existing threads)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=max_workers,
+                                       thread_name_prefix="scrape_all")
+        return _pool
+
+
+def run_all(app, scrapers: dict, max_workers: int = _MAX_WORKERS) -> dict:
+    """
+    Execute every callable in `scrapers` (label -> zero-arg scraper fn) on
+    the shared thread pool, each inside an app context so persist_report and
+    logging work off the request thread.
+
+    Returns {label: (result, error)} — exactly one of the pair is not None
+    unless the scraper legitimately returned None.
+    """
+    def _one(item):
+        label, fn = item
+        with app.app_context():
+            try:
+                return label, fn(), None
+            except Exception as e:  # surface per-scraper, don't kill the batch
+                app.logger.error(f"{label!r} scraper failed: {e}")
+                return label, None, e
+
+    done = list(_get_pool(max_workers).map(_one, scrapers.items()))
+    return {label: (result, error) for label, result, error in done}
+
+
+def main():
+    from app import create_app
+    from app.figurella_reports.routes import SCRAPERS
+
+    app = create_app()
+    results = run_all(app, {lbl: cfg["fn"] for lbl, cfg in SCRAPERS.items()})
+    for label, (_, error) in results.items():
+        print(f"{'❌' if error else '✅'} {label}" + (f": {error}" if error else ""))
+
+
+if __name__ == "__main__":
+    main()
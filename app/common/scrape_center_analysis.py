@@ -1,39 +1,30 @@
 # app/common/scrape_center_analysis.py
 import os
-import time
 import sys
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
 
+import lxml.html as lhtml
 import pandas as pd
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
 
+from app.common import _browser
+from app.common._browser import get_date_range
 from app.common.utils import persist_report
 
-# ───────── CONFIG ─────────
-LOGIN_URL    = "https://newton.hosting.memetic.it/login"
-USERNAME     = "Tutor"
-PASSWORD     = "FiguMass2025$"
-
-
-# ───────── DATE RANGE ─────────
-def get_date_range(months_back: int = 6, months_forward: int = 6):
-    today     = datetime.today()
-    from_date = (today - relativedelta(months=months_back)).strftime("%m/%d/%Y")
-    to_date   = (today + relativedelta(months=months_forward)).strftime("%m/%d/%Y")
-    return from_date, to_date
-
+# ───────── TABLE → DATAFRAME ─────────
+def _table_to_df(tbl) -> pd.DataFrame:
+    """
+    Build a DataFrame straight from an already-parsed lxml table node.
 
-# ───────── LOGIN ─────────
-def login(page):
-    page.goto(LOGIN_URL)
-    page.wait_for_load_state("networkidle")
-    page.wait_for_selector("#txtUsername", timeout=10_000)
-    page.fill("#txtUsername", USERNAME)
-    page.fill("#txtPassword", PASSWORD)
-    page.click("#btnAccedi")
-    page.wait_for_selector("text=Reports", timeout=15_000)
+    pd.read_html(str(tbl)) serialized the node back to HTML and re-parsed
+    it with a second lxml pass — three parses of the same DOM per table.
+    Mirrors read_html's header rule: a leading all-<th> row becomes columns.
+    """
+    cells = [tr.xpath("./th|./td") for tr in tbl.xpath(".//tr")]
+    rows = [[c.text_content().strip() for c in row] for row in cells if row]
+    if not rows:
+        return pd.DataFrame()
+    if all(c.tag == "th" for c in cells[0]):
+        return pd.DataFrame(rows[1:], columns=rows[0])
+    return pd.DataFrame(rows)
 
 
 # ───────── SCRAPE & PARSE ─────────
@@ -45,36 +36,32 @@ def scrape_center_analysis(from_date: str, to_date: str) -> dict[str, pd.DataFra
       - Payments
       - Contracts
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        ctx     = browser.new_context()
-        page    = ctx.new_page()
-
-        login(page)
-        page.click("text=Reports")
-        time.sleep(1)
-
-        page.fill("#ctl00_cphMain_SelectDataDal_txtDataSel", from_date)
-        page.fill("#ctl00_cphMain_SelectDataAl_txtDataSel", to_date)
-        page.click("text=Do Report")
-        page.wait_for_selector("#ctl00_cphMain_hlyDownloadHTML", timeout=15_000)
-
-        href = page.get_attribute("#ctl00_cphMain_hlyDownloadHTML", "href")
-        report_url = (
-            f"https://newton.hosting.memetic.it/assist/{href}"
-            if href else page.url
-        )
-
-        report_page = ctx.new_page()
-        report_page.goto(report_url)
-        report_page.wait_for_load_state("networkidle")
-        time.sleep(2)
+    # Shared logged-in session — skips the Chromium cold start and login
+    # round-trip on every call after the first.
+    page = _browser.get_page()
+
+    # Wait for the date field the menu click reveals, not a fixed second.
+    page.click("text=Reports")
+    page.wait_for_selector("#ctl00_cphMain_SelectDataDal_txtDataSel", timeout=10_000)
+
+    page.fill("#ctl00_cphMain_SelectDataDal_txtDataSel", from_date)
+    page.fill("#ctl00_cphMain_SelectDataAl_txtDataSel", to_date)
+    page.click("text=Do Report")
+    page.wait_for_selector("#ctl00_cphMain_hlyDownloadHTML", timeout=15_000)
+
+    href = page.get_attribute("#ctl00_cphMain_hlyDownloadHTML", "href")
+    report_url = (
+        f"https://newton.hosting.memetic.it/assist/{href}"
+        if href else page.url
+    )
 
-        html  = report_page.content()
-        soup  = BeautifulSoup(html, "lxml")
-        tables = soup.find_all("table")
+    # The export is static HTML — fetch it with the session's cookies over
+    # plain HTTP instead of spinning up a second renderer page.
+    html = _browser.http_session(page.context).get(report_url, timeout=30).text
 
-        browser.close()
+    # lxml parses the report page directly — BeautifulSoup added a second
+    # tree-building layer on top of the same lxml parser underneath.
+    tables = lhtml.fromstring(html).xpath("//table")
 
     if len(tables) < 4:
         print(f"❌ Expected ≥4 tables but found {len(tables)}; aborting.")
@@ -91,17 +78,32 @@ def scrape_center_analysis(from_date: str, to_date: str) -> dict[str, pd.DataFra
 
     result: dict[str, pd.DataFrame] = {}
     for tbl, name in zip(main_tables, sheet_names):
+        if name == "Payments":
+            # ~20-row key/value table: read the pairs straight off the
+            # nodes — a vectorized pandas pipeline dwarfs the actual work.
+            pairs = [
+                (tds[0].text_content().strip().rstrip(":"),
+                 tds[1].text_content().strip())
+                for tr in tbl.xpath(".//tr")
+                if len(tds := tr.xpath("./td")) == 2
+            ]
+            if not pairs:
+                print(f"❌ Empty table for '{name}'")
+                continue
+            result[name] = pd.DataFrame(pairs, columns=["Metric", "Value"])
+            continue
+
         try:
-            df = pd.read_html(str(tbl), flavor="lxml")[0]
+            df = _table_to_df(tbl)
         except Exception as e:
             print(f"❌ Failed to parse '{name}': {e}")
             continue
+        if df.empty:
+            print(f"❌ Empty table for '{name}'")
+            continue
 
         # normalize columns
-        if name == "Payments":
-            df.columns = ["Metric", "Value"]
-            df["Metric"] = df["Metric"].str.strip().str.rstrip(":")
-        elif name == "Contracts" and len(df.columns) >= 6:
+        if name == "Contracts" and len(df.columns) >= 6:
             df.columns = ["Name", "Surname", "Assistant", "Date", "Details", "Amount"]
 
         result[name] = df
@@ -2,9 +2,11 @@
 
 import sys
 from datetime import datetime, timedelta
+import lxml.html as lhtml
 from playwright.sync_api import sync_playwright
 import pandas as pd
 
+from app.common import _browser
 from app.common.utils import persist_report
 
 LOGIN_URL = "https://newton.hosting.memetic.it/login"
@@ -34,17 +36,20 @@ def scrape_contracts(from_date: str, to_date: str) -> pd.DataFrame:
     """
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        ctx     = browser.new_context()
+        # Saved cookie jar: warm starts land on the dashboard without
+        # replaying the credential form.
+        ctx     = _browser.authed_context(browser)
         page    = ctx.new_page()
 
         print("🔐 Logging in...")
-        login(page)
+        _browser.ensure_logged_in(page, login)
 
         print("📁 Navigating to 'Contracts' report...")
+        # Wait for what each click reveals instead of padding with timeouts.
         page.click("text=Reports")
-        page.wait_for_timeout(1_000)
+        page.wait_for_selector("text=Contracts", state="visible", timeout=5_000)
         page.click("text=Contracts")
-        page.wait_for_timeout(1_000)
+        page.wait_for_selector("input[type='text']", timeout=10_000)
 
         print(f"📆 Setting date range: {from_date} to {to_date}")
         inputs = page.locator("input[type='text']")
@@ -59,24 +64,30 @@ def scrape_contracts(from_date: str, to_date: str) -> pd.DataFrame:
         report_page.wait_for_selector("table", timeout=15_000)
 
         print("📥 Extracting table data...")
-        rows    = report_page.locator("table tr")
-        header_cells = rows.nth(0).locator("th").all()
-        headers = [h.inner_text().strip() for h in header_cells] if header_cells else None
+        # One round-trip for the whole table instead of a CDP call per cell.
+        html = report_page.locator("table").first.evaluate("el => el.outerHTML")
+        browser.close()
 
-        data = []
-        for i in range(1, rows.count()):
-            cols = rows.nth(i).locator("td").all()
-            row  = [c.inner_text().strip() for c in cols]
-            if row:
-                data.append(row)
+    tree = lhtml.fromstring(html)
+    header_cells = tree.xpath(".//tr[1]/th")
+    headers = [h.text_content().strip() for h in header_cells] if header_cells else None
 
-        browser.close()
+    data = []
+    for tr in tree.xpath(".//tr")[1:]:
+        # Intern short cell values — repeated statuses/assistants share one
+        # str object instead of allocating a fresh copy per row.
+        row = tuple(sys.intern(v) if len(v) < 32 else v
+                    for v in (td.text_content().strip() for td in tr.xpath("./td")))
+        if row:
+            data.append(row)
 
     if not data:
         print("⚠️ No rows found in 'Contracts' report.")
         return pd.DataFrame()
 
-    df = pd.DataFrame(data, columns=headers) if headers else pd.DataFrame(data)
+    # from_records on tuples skips the generic 2-D ndarray inference pass.
+    df = (pd.DataFrame.from_records(data, columns=headers) if headers
+          else pd.DataFrame.from_records(data))
     return df
 
 
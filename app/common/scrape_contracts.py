@@ -1,36 +1,19 @@
 # app/common/scrape_contracts.py
 
+import re
 import sys
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
 
+import lxml.html as lhtml
 import pandas as pd
 from playwright.sync_api import sync_playwright
 
+from app.common import _browser
+from app.common._browser import get_date_range
 from app.common.cleaners import drop_unwanted_rows
 from app.common.utils    import persist_report
 
-LOGIN_URL = "https://newton.hosting.memetic.it/login"
-USERNAME  = "Tutor"
-PASSWORD  = "FiguMass2025$"
-
-
-def get_date_range(months_back: int = 6, months_forward: int = 6):
-    today = datetime.today()
-    return (
-        (today - relativedelta(months=months_back)).strftime("%m/%d/%Y"),
-        (today + relativedelta(months=months_forward)).strftime("%m/%d/%Y")
-    )
-
-
-def login(page):
-    page.goto(LOGIN_URL)
-    page.wait_for_load_state("networkidle")
-    page.wait_for_selector("#txtUsername", timeout=10_000)
-    page.fill("#txtUsername", USERNAME)
-    page.fill("#txtPassword", PASSWORD)
-    page.click("#btnAccedi")
-    page.wait_for_selector("text=Reports", timeout=15_000)
+# Compiled once — the Amount column is scrubbed on every scheduled run.
+_AMOUNT_RX = re.compile(r'[^\d.]+')
 
 
 def scrape_contracts(from_date: str, to_date: str) -> pd.DataFrame:
@@ -40,13 +23,16 @@ def scrape_contracts(from_date: str, to_date: str) -> pd.DataFrame:
     """
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        page = browser.new_context().new_page()
+        # Saved cookie jar: warm starts land on the dashboard without
+        # replaying the credential form.
+        page = _browser.authed_context(browser).new_page()
+        _browser.ensure_logged_in(page)
 
-        login(page)
+        # Wait for what each click reveals instead of padding with timeouts.
         page.click("text=Reports")
-        page.wait_for_timeout(500)
+        page.wait_for_selector("text=Contracts", state="visible", timeout=5_000)
         page.click("text=Contracts")
-        page.wait_for_timeout(500)
+        page.wait_for_selector("#ctl00_cphMain_SelectDataDal_txtDataSel", timeout=10_000)
 
         page.fill("#ctl00_cphMain_SelectDataDal_txtDataSel", from_date)
         page.fill("#ctl00_cphMain_SelectDataAl_txtDataSel", to_date)
@@ -59,27 +45,32 @@ def scrape_contracts(from_date: str, to_date: str) -> pd.DataFrame:
             return pd.DataFrame()
 
         report_url = f"https://newton.hosting.memetic.it/assist/{href}"
-        page.goto(report_url)
-        page.wait_for_selector("table", timeout=10_000)
-
-        tbl = page.locator("table").first
-        headers = [th.inner_text().strip() for th in tbl.locator("th").all()]
-
-        data = []
-        rows = tbl.locator("tr")
-        for i in range(1, rows.count()):
-            cells = rows.nth(i).locator("td").all()
-            values = [c.inner_text().strip() for c in cells]
-            if len(values) != len(headers) or values == headers:
-                continue
-            data.append(values)
-
+        # The export is static HTML — fetch it with the session's cookies
+        # over plain HTTP instead of navigating the renderer to it.
+        html = _browser.http_session(page.context).get(report_url, timeout=30).text
         browser.close()
 
+    tables = lhtml.fromstring(html).xpath("//table")
+    if not tables:
+        return pd.DataFrame()
+    tbl = tables[0]
+    headers = [th.text_content().strip() for th in tbl.xpath(".//th")]
+
+    data = []
+    for tr in tbl.xpath(".//tr"):
+        # Intern short cell values: Status/Assistant/Details repeat across
+        # thousands of rows, so one shared str each instead of N copies.
+        values = [sys.intern(v) if len(v) < 32 else v
+                  for v in (td.text_content().strip() for td in tr.xpath("./td"))]
+        if len(values) != len(headers) or values == headers:
+            continue
+        data.append(tuple(values))
+
     if not data:
         return pd.DataFrame(columns=headers)
 
-    df = pd.DataFrame(data, columns=headers)
+    # from_records on tuples skips the generic 2-D ndarray inference pass.
+    df = pd.DataFrame.from_records(data, columns=headers)
 
     # Drop true “header” rows if they slipped through
     mask_header = (
@@ -90,23 +81,19 @@ def scrape_contracts(from_date: str, to_date: str) -> pd.DataFrame:
     df = df.loc[~mask_header].reset_index(drop=True)
 
     # Rename “Ammount” → “Amount”
-    for col in df.columns:
-        if col.lower().startswith('ammount'):
-            df.rename(columns={col: 'Amount'}, inplace=True)
+    df.rename(columns=lambda c: 'Amount' if str(c).lower().startswith('ammount') else c,
+              inplace=True)
 
     # Ensure and format Amount
     if 'Amount' not in df:
         df['Amount'] = 0.0
-    df['Amount'] = (
-        pd.to_numeric(
-            df['Amount']
-              .astype(str)
-              .str.replace(r'[^\d\.]+', '', regex=True),
-            errors='coerce'
-        )
-        .fillna(0.0)
-        .apply(lambda x: f"${x:,.2f}")
-    )
+    amount = pd.to_numeric(
+        df['Amount'].astype(str).str.replace(_AMOUNT_RX, '', regex=True),
+        errors='coerce'
+    ).fillna(0.0)
+    # Keep the "$1,234.56" strings downstream display/history expect, but
+    # build them via map(str.format) — no per-row lambda closure.
+    df['Amount'] = "$" + amount.round(2).map("{:,.2f}".format)
 
     # Drop any duplicate columns
     df = df.loc[:, ~df.columns.duplicated()]
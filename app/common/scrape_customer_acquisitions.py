@@ -1,40 +1,17 @@
 # app/common/scrape_customer_acquisition.py
 
 import sys
-import time
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from io import StringIO
 
+import lxml.html as lhtml
 import pandas as pd
 from playwright.sync_api import sync_playwright
-import win32clipboard
 
+from app.common import _browser
+from app.common._browser import get_date_range
 from app.common.cleaners import drop_unwanted_rows
 from app.common.utils    import persist_report
 
-LOGIN_URL = "https://newton.hosting.memetic.it/login"
-USERNAME  = "Tutor"
-PASSWORD  = "FiguMass2025$"
-
-
-def get_date_range(months_back: int = 6, months_forward: int = 6):
-    today = datetime.today()
-    return (
-        (today - relativedelta(months=months_back)).strftime("%m/%d/%Y"),
-        (today + relativedelta(months=months_forward)).strftime("%m/%d/%Y")
-    )
-
-
-def login(page):
-    page.goto(LOGIN_URL)
-    page.wait_for_load_state("networkidle")
-    page.wait_for_selector("#txtUsername", timeout=10_000)
-    page.fill("#txtUsername", USERNAME)
-    page.fill("#txtPassword", PASSWORD)
-    page.click("#btnAccedi")
-    page.wait_for_selector("text=Reports", timeout=15_000)
-
 
 def scrape_customer_acquisition(from_date: str, to_date: str) -> pd.DataFrame:
     """
@@ -43,14 +20,17 @@ def scrape_customer_acquisition(from_date: str, to_date: str) -> pd.DataFrame:
     """
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        ctx     = browser.new_context()
+        # Saved cookie jar: warm starts land on the dashboard without
+        # replaying the credential form.
+        ctx     = _browser.authed_context(browser)
         page    = ctx.new_page()
+        _browser.ensure_logged_in(page)
 
-        login(page)
+        # Wait for what each click reveals instead of padding with timeouts.
         page.click("text=Reports")
-        page.wait_for_timeout(1_000)
-        page.click("#ctl00_cphMain_lnkCustomerAcquisition", timeout=15_000)
-        page.wait_for_timeout(1_000)
+        page.wait_for_selector("#ctl00_cphMain_lnkCustomerAcquisition", timeout=15_000)
+        page.click("#ctl00_cphMain_lnkCustomerAcquisition")
+        page.wait_for_selector("#ctl00_cphMain_SelectDataDal_txtDataSel", timeout=10_000)
 
         page.fill("#ctl00_cphMain_SelectDataDal_txtDataSel", from_date)
         page.fill("#ctl00_cphMain_SelectDataAl_txtDataSel", to_date)
@@ -59,37 +39,27 @@ def scrape_customer_acquisition(from_date: str, to_date: str) -> pd.DataFrame:
 
         href = page.get_attribute("#ctl00_cphMain_hlyDownloadHTML", "href")
         report_url = f"https://newton.hosting.memetic.it/assist/{href}"
-        report_page = ctx.new_page()
-        report_page.goto(report_url)
-        report_page.wait_for_load_state("networkidle")
-        time.sleep(2)
-
-        # find the table containing "Acquisition date"
-        table_html = None
-        for tbl in report_page.locator("table").all():
-            html = tbl.evaluate("el => el.outerHTML")
-            if "Acquisition date" in html:
-                table_html = html
-                break
-
+        # The export is static HTML — fetch it with the session's cookies
+        # over plain HTTP instead of opening a second renderer page, then
+        # scan for the target table in-process.
+        html = _browser.http_session(ctx).get(report_url, timeout=30).text
         browser.close()
 
+    table_html = next(
+        (lhtml.tostring(tbl, encoding="unicode")
+         for tbl in lhtml.fromstring(html).xpath("//table")
+         if "Acquisition date" in tbl.text_content()),
+        None
+    )
+
     if not table_html:
         print("❌ Customer Acquisition table not found.")
         return pd.DataFrame()
 
-    # Use clipboard to preserve HTML encoding
-    win32clipboard.OpenClipboard()
-    win32clipboard.EmptyClipboard()
-    win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, table_html)
-    win32clipboard.CloseClipboard()
-    time.sleep(0.5)
-    win32clipboard.OpenClipboard()
-    raw_html = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
-    win32clipboard.CloseClipboard()
-
-    # Parse and clean
-    df = pd.read_html(StringIO(raw_html), flavor="lxml")[0]
+    # Parse and clean — the HTML is already a str; the old Windows-clipboard
+    # round-trip (write, half-second sleep, read back) was a no-op encoding-
+    # wise and made the scraper Windows-only and single-flight.
+    df = pd.read_html(StringIO(table_html), flavor="lxml")[0]
     df = df.iloc[3:].reset_index(drop=True)  # drop header artifacts
     df.columns = [
         "Name", "Email", "Phone",
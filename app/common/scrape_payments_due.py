@@ -2,41 +2,16 @@
 
 import sys
 import time
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
 
 import pandas as pd
 from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 
+from app.common import _browser
+from app.common._browser import get_date_range
 from app.common.cleaners import drop_unwanted_rows
 from app.common.utils    import persist_report
 
-LOGIN_URL = "https://newton.hosting.memetic.it/login"
-USERNAME  = "Tutor"
-PASSWORD  = "FiguMass2025$"
-
-
-def get_date_range(months_back: int = 6, months_forward: int = 6):
-    """
-    Default window: today -6mo through today +6mo, formatted MM/DD/YYYY.
-    """
-    today = datetime.today()
-    return (
-        (today - relativedelta(months=months_back)).strftime("%m/%d/%Y"),
-        (today + relativedelta(months=months_forward)).strftime("%m/%d/%Y")
-    )
-
-
-def login(page):
-    page.goto(LOGIN_URL)
-    page.wait_for_load_state("networkidle")
-    page.wait_for_selector("#txtUsername", timeout=10_000)
-    page.fill("#txtUsername", USERNAME)
-    page.fill("#txtPassword", PASSWORD)
-    page.click("#btnAccedi")
-    page.wait_for_selector("text=Reports", timeout=15_000)
-
 
 def scrape_payments_due(from_date: str, to_date: str) -> pd.DataFrame:
     """
@@ -48,10 +23,10 @@ def scrape_payments_due(from_date: str, to_date: str) -> pd.DataFrame:
 
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        ctx     = browser.new_context()
+        ctx     = _browser.authed_context(browser)
         page    = ctx.new_page()
 
-        login(page)
+        _browser.ensure_logged_in(page)
         page.click("text=Reports")
         page.wait_for_timeout(1_000)
         page.click("text=Payments due", timeout=15_000)
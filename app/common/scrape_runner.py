@@ -0,0 +1,74 @@
+# app/common/scrape_runner.py
+"""
+Run the IBF, Last Session and Payments Done scrapes concurrently.
+
+The three reports are I/O-bound (navigate, wait, download), so running
+them at once collapses three sequential login+navigate+wait cycles into
+roughly one wall-clock pass. Sync Playwright objects are bound to their
+creating thread, so concurrency comes from a small thread pool where
+each worker drives its own per-thread _browser session — not from
+coroutines sharing one context.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from app.common._browser import get_date_range
+from app.common.scrape_ibf import scrape_ibf
+from app.common.scrape_last_session import scrape_last_session
+from app.common.scrape_payments_done import scrape_payments_done
+from app.common.utils import persist_report
+
+# label -> (scrape function, persist_report key)
+_REPORTS = {
+    "IBF":           (scrape_ibf,           "ibf"),
+    "Last Session":  (scrape_last_session,  "last_session"),
+    "Payments Done": (scrape_payments_done, "payments_done"),
+}
+
+
+def scrape_all(from_date: str, to_date: str) -> dict[str, pd.DataFrame]:
+    """
+    Scrape all three reports for the window concurrently and return a
+    mapping of report label -> DataFrame (empty frame on failure).
+    """
+    def _run(item):
+        label, (fn, _) = item
+        try:
+            return label, fn(from_date, to_date)
+        except Exception as e:
+            print(f"❌ Failed to scrape {label}: {e}")
+            return label, pd.DataFrame()
+
+    with ThreadPoolExecutor(max_workers=len(_REPORTS)) as pool:
+        return dict(pool.map(_run, _REPORTS.items()))
+
+
+def main():
+    # parse CLI args or default six months back through today
+    if len(sys.argv) == 3:
+        frm, to = sys.argv[1], sys.argv[2]
+    else:
+        frm, to = get_date_range(months_forward=0)
+
+    print(f"⏱️  Scraping IBF, Last Session and Payments Done from {frm} to {to}…")
+    results = scrape_all(frm, to)
+
+    for label, df in results.items():
+        if df.empty:
+            print(f"⚠️ {label} report contained no data.")
+            continue
+        persist_report(
+            {label: df},
+            report_key=_REPORTS[label][1],
+            to_db=True,
+            to_static_excel=False,
+            to_download_excel=False
+        )
+        print(f"✅ {label} persisted to database.")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,24 @@ import json
 import pandas as pd
 import numpy as np
 
+# Prefer the Rust calamine reader for the merge-read of existing reports;
+# they're value-only workbooks, so formula/style fidelity isn't needed.
+try:
+    import python_calamine  # noqa: F401
+    _READ_KW = {"engine": "calamine"}
+except ImportError:
+    _READ_KW = {"engine": "openpyxl",
+                "engine_kwargs": {"read_only": True, "data_only": True}}
+
+# xlsxwriter streams rows out in constant memory; openpyxl builds the whole
+# OOXML tree first, which hurts on the rolling report histories.
+try:
+    import xlsxwriter  # noqa: F401
+    _WRITE_KW = {"engine": "xlsxwriter",
+                 "engine_kwargs": {"options": {"constant_memory": True}}}
+except ImportError:
+    _WRITE_KW = {"engine": "openpyxl"}
+
 from flask import flash, current_app
 from app import db
 from app.models import Report, ReportHistory
@@ -25,14 +43,14 @@ def _export_excel(section_data: dict[str, pd.DataFrame],
     existing = {}
     if os.path.exists(path):
         try:
-            existing = pd.read_excel(path, sheet_name=None)
+            existing = pd.read_excel(path, sheet_name=None, **_READ_KW)
         except PermissionError:
             flash("❌ Cannot save — please close the Excel file first.", "error")
             current_app.logger.error(f"PermissionError reading {path}")
             return
 
     try:
-        with pd.ExcelWriter(path, engine="openpyxl", mode="w") as writer:
+        with pd.ExcelWriter(path, mode="w", **_WRITE_KW) as writer:
             for sheet_name, new_df in section_data.items():
                 cleaned = new_df.replace(r"^\s*$", np.nan, regex=True)
                 if "Date" in cleaned.columns:
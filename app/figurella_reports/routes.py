@@ -13,6 +13,7 @@ from flask import (
 )
 
 from app.common.cleaners import drop_unwanted_rows
+from app.common.scrape_all import run_all
 from app.common.utils import save_report
 from build_history import main as build_all_history
 from app.models import Report, ReportHistory
@@ -268,14 +269,15 @@ def download_history(report_name):
 @reports_bp.route('/reports/refresh_all', methods=['POST'])
 def refresh_all_reports():
     errors, total_rows = [], 0
+    # One thread-pool pass over all scrapers: wall clock ≈ slowest scraper
+    # instead of the sum of all of them.
+    results = run_all(current_app._get_current_object(),
+                      {c['label']: SCRAPERS[c['label']]['fn'] for c in REPORT_CARDS})
     for card in REPORT_CARDS:
         label, key = card['label'], card['key']
-        fn = SCRAPERS[label]['fn']
-        try:
-            result = fn()
-        except Exception as e:
-            msg = f"{label!r} scraper failed: {e}"
-            current_app.logger.error(msg); errors.append(msg); continue
+        result, error = results[label]
+        if error is not None:
+            errors.append(f"{label!r} scraper failed: {error}"); continue
 
         if result is None:
             errors.append(f"{label!r} scraper returned None, skipping."); continue
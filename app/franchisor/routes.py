@@ -2,7 +2,7 @@
 from flask import Blueprint, render_template, request, jsonify
 import threading, re, traceback
 from app.common.create_appointment import create_appointment
-from app.common.check_availability import get_open_slots  # uses semantic badge classes
+from app.common.check_availability import get_open_slots, invalidate_slots  # uses semantic badge classes
 
 franchisor_bp = Blueprint("franchisor", __name__, template_folder="../templates")
 
@@ -167,7 +167,11 @@ def franchisor_create():
                 customer_name=customer_name,
                 memo=memo
             )
-            return _coerce_result(res, date_iso, column_label, time_label, customer_name)
+            result = _coerce_result(res, date_iso, column_label, time_label, customer_name)
+            if result["ok"]:
+                # The booked slot must disappear from the next availability check.
+                invalidate_slots(date_iso)
+            return result
         except Exception as e:
             print(f"[franchisor.create] background error: {e}")
             return {"ok": False, "message": str(e)}
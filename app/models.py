@@ -1,7 +1,8 @@
 # app/models.py
 from datetime import datetime
 from sqlalchemy.sql import func
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, event
+from sqlalchemy.orm import validates
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from app import db
 
@@ -14,12 +15,32 @@ class Client(db.Model):
     email      = db.Column(db.String(256))
     phone      = db.Column(db.String(50))
     status     = db.Column(db.String(50))
+    # Normalized copy of status, maintained on write (see listener below),
+    # so filters are a plain equality on an indexed column.
+    status_key = db.Column(db.String(50), index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # (name, email) is the upsert identity used by refresh_clients; the
+    # unique index lets ON CONFLICT do the existence check in one statement.
+    __table_args__ = (
+        db.Index('uq_clients_name_email', 'name', 'email', unique=True),
+    )
+
+    @validates('status')
+    def _norm_status(self, key, value):
+        """Canonicalize on write so reads never re-strip."""
+        return (value or '').strip()
+
     def __repr__(self):
         return f'<Client {self.name}>'
 
 
+@event.listens_for(Client.status, 'set')
+def _client_status_key(target, value, oldvalue, initiator):
+    """Keep status_key in sync whenever status is assigned."""
+    target.status_key = (value or '').strip().casefold()
+
+
 class Report(db.Model):
     __tablename__ = 'reports'
 
@@ -56,6 +77,13 @@ class ChartEntry(db.Model):
     created_at  = db.Column(db.DateTime(timezone=True), server_default=func.now())
     updated_at  = db.Column(db.DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Every hot query here filters by (client_name, sheet) and sorts by
+    # created_at — make that an index range scan.
+    __table_args__ = (
+        db.Index('ix_chart_entries_client_sheet_created',
+                 'client_name', 'sheet', 'created_at'),
+    )
+
     def __repr__(self):
         return f'<ChartEntry {self.client_name} [{self.sheet}]>'
 
@@ -0,0 +1,34 @@
+"""add unique (name, email) index to clients for upsert identity"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Alembic identifiers
+revision = "a15e8c42d7b9"
+down_revision = "e92b5d7c0a36"
+branch_labels = None
+depends_on = None
+
+_INDEX = "uq_clients_name_email"
+
+
+def _has_index(table: str, name: str) -> bool:
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+    return any(ix["name"] == name for ix in insp.get_indexes(table))
+
+
+def upgrade():
+    if not _has_index("clients", _INDEX):
+        # Drop older duplicates first (keep the most recent row per pair) —
+        # they came from the pre-upsert refresh loop double-inserting.
+        op.execute(
+            "DELETE FROM clients WHERE id NOT IN "
+            "(SELECT MAX(id) FROM clients GROUP BY name, email)"
+        )
+        op.create_index(_INDEX, "clients", ["name", "email"], unique=True)
+
+
+def downgrade():
+    if _has_index("clients", _INDEX):
+        op.drop_index(_INDEX, table_name="clients")
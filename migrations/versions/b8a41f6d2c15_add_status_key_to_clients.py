@@ -0,0 +1,35 @@
+"""add normalized status_key column to clients (idempotent)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Alembic identifiers
+revision = "b8a41f6d2c15"
+down_revision = "27312b64a3f5"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+    return any(col["name"] == column for col in insp.get_columns(table))
+
+
+def upgrade():
+    # Use batch mode for SQLite compatibility
+    if not _has_column("clients", "status_key"):
+        with op.batch_alter_table("clients") as batch:
+            batch.add_column(sa.Column("status_key", sa.String(length=50), nullable=True))
+
+        # Backfill from existing statuses (lower(trim(...)) is the best
+        # portable approximation of Python's casefold for our data)
+        op.execute("UPDATE clients SET status_key = lower(trim(status)) WHERE status IS NOT NULL")
+        op.create_index("ix_clients_status_key", "clients", ["status_key"])
+
+
+def downgrade():
+    if _has_column("clients", "status_key"):
+        op.drop_index("ix_clients_status_key", table_name="clients")
+        with op.batch_alter_table("clients") as batch:
+            batch.drop_column("status_key")
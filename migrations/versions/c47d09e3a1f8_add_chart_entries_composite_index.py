@@ -0,0 +1,30 @@
+"""add composite (client_name, sheet, created_at) index to chart_entries"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Alembic identifiers
+revision = "c47d09e3a1f8"
+down_revision = "b8a41f6d2c15"
+branch_labels = None
+depends_on = None
+
+_INDEX = "ix_chart_entries_client_sheet_created"
+
+
+def _has_index(table: str, name: str) -> bool:
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+    return any(ix["name"] == name for ix in insp.get_indexes(table))
+
+
+def upgrade():
+    # Plain ascending composite index: Postgres and SQLite both scan it
+    # backwards for the created_at DESC orderings used in app/charts.
+    if not _has_index("chart_entries", _INDEX):
+        op.create_index(_INDEX, "chart_entries", ["client_name", "sheet", "created_at"])
+
+
+def downgrade():
+    if _has_index("chart_entries", _INDEX):
+        op.drop_index(_INDEX, table_name="chart_entries")
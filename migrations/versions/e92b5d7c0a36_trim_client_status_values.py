@@ -0,0 +1,18 @@
+"""trim stored client status values (now normalized on write)"""
+
+from alembic import op
+
+# Alembic identifiers
+revision = "e92b5d7c0a36"
+down_revision = "c47d09e3a1f8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("UPDATE clients SET status = trim(status) WHERE status IS NOT NULL")
+
+
+def downgrade():
+    # Whitespace is unrecoverable (and unwanted); nothing to undo.
+    pass